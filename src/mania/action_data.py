@@ -70,28 +70,35 @@ class ManiaActionData(np.ndarray):
             if cols == None:
                 raise TypeError('Not a mania replay!')
 
-        # Keep track of timing
-        timing = 0
+        timings = np.cumsum(replay.get_time_data())
+        presses = np.asarray(replay.get_xpos_data()).astype('<u4')
 
-        # Previous state of whether finger is holding key down
-        hold_state = np.asarray([ None for _ in range(cols) ])
+        # Key state of each column on each frame, and its transitions: +1 on press, -1 on release.
+        # Unpacking the little endian bytes of the key bitmask puts column n's bit at index n.
+        is_key_hold = np.unpackbits(presses.view(np.uint8).reshape(-1, 4), axis=1, bitorder='little')[:, :cols].astype(np.int8)
+        transitions = np.diff(is_key_hold, axis=0, prepend=0)
 
-        replay_data = []
+        # Column-major, so each column's presses and releases are in frame order
+        press_cols, press_frames     = np.nonzero(transitions.T == 1)
+        release_cols, release_frames = np.nonzero(transitions.T == -1)
 
-        data = zip(replay.get_time_data(), replay.get_xpos_data())
-        for tdelta, key_press in data:
-            timing += tdelta
+        # The n-th release in a column ends the n-th press in that column. A press still
+        # held at the end of the replay has no release and is left out.
+        press_col_starts   = np.searchsorted(press_cols, np.arange(cols))
+        release_col_starts = np.searchsorted(release_cols, np.arange(cols))
+        release_press_idxs = np.arange(len(release_cols)) - release_col_starts[release_cols] + press_col_starts[release_cols]
 
-            for col in range(cols):
-                is_key_hold = (int(key_press) & (1 << col)) > 0
-                
-                if hold_state[col] != None and not is_key_hold:
-                    replay_data.append([ hold_state[col], timing, col ])
-                    hold_state[col] = None
-                elif hold_state[col] == None and is_key_hold:
-                    hold_state[col] = timing
+        # Order notes by when they got released, then by column
+        sort_idx = np.lexsort((release_cols, release_frames))
+        release_cols       = release_cols[sort_idx]
+        release_frames     = release_frames[sort_idx]
+        release_press_idxs = release_press_idxs[sort_idx]
 
-        return np.asarray(replay_data)
+        return np.column_stack((
+            timings[press_frames[release_press_idxs]],
+            timings[release_frames],
+            release_cols
+        ))
 
 
     @staticmethod
@@ -112,7 +119,7 @@ class ManiaActionData(np.ndarray):
         if action_data.shape[0] == 0:
             return 0
 
-        return int(np.max(action_data[:, ManiaActionData.IDX_COL]) - np.min(action_data[:, ManiaActionData.IDX_COL])) + 1
+        return int(np.ptp(action_data[:, ManiaActionData.IDX_COL])) + 1
 
 
     @staticmethod
@@ -241,14 +248,15 @@ class ManiaActionData(np.ndarray):
         numpy.array
         ``action_data`` slice of data between the times specified
         """
-        idx_map = np.arange(action_data.shape[0])
-        col_max = int(np.max(action_data[:, ManiaActionData.IDX_COL]))
+        cols = action_data[:, ManiaActionData.IDX_COL]
 
-        for c in range(col_max):
-            map_col_mask = action_data[:, ManiaActionData.IDX_COL] == c
-            idx_sort = action_data[map_col_mask][:, ManiaActionData.IDX_STIME].argsort()
+        # Indices grouped by column and sorted by start time within each column. Each column's
+        # group is written back over the positions that column occupies in ``action_data``.
+        idx_sort = np.lexsort((action_data[:, ManiaActionData.IDX_STIME], cols))
+        col_positions = np.argsort(cols, kind='stable')
 
-            idx_map[map_col_mask] = idx_map[map_col_mask][idx_sort]
+        idx_map = np.empty(action_data.shape[0], dtype=np.int64)
+        idx_map[col_positions] = idx_sort
 
         return idx_map
             
\ No newline at end of file
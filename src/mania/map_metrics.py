@@ -148,34 +148,30 @@ class ManiaMapMetrics():
         if not np.any(hold_mask):
             return ret
 
-        # These indices will be uses as references as to where place data in ret
-        idx_ref = np.arange(action_data.shape[0])
-                
         # Convenience vars
         ts = action_data[:, ManiaActionData.IDX_STIME]  # Hold note start times
         te = action_data[:, ManiaActionData.IDX_ETIME]  # Hold note end times
         ky = action_data[:, ManiaActionData.IDX_COL]    # Hold note column
 
-        # Operate on data in chunks to limit memory usage when using meshgrid
-        for i in range(0, action_data.shape[0], 500):
-            # Get a chunk of data to operate on
-            idx_start = i
-            idx_end   = min(action_data.shape[0], i+1000)
-            idx = idx_ref[idx_start : idx_end]
-            
-            # Used to operate every note on every other note
-            a, b = np.meshgrid(idx, idx)
-            data = np.ones((idx.shape[0], idx.shape[0], ), dtype=np.bool8)
+        for col in np.unique(ky):
+            col_mask = (ky == col)
+            nbr_mask = (np.abs(ky - col) == 1)
 
-            # Checks if note b's start time is between note a's start and end times 
-            data &= (ts[a] < ts[b]) & (ts[b] < te[a])
+            # Notes in this column by start time, along with the latest end time of those started so far
+            col_sort = np.argsort(ts[col_mask], kind='stable')
+            col_ts = ts[col_mask][col_sort]
+            col_te_max = np.maximum.accumulate(te[col_mask][col_sort])
 
-            # Check if notes are neigboring and are not themselves
-            data &= np.abs(ky[a] - ky[b]) == 1
+            # A press in a neighboring column happens during a hold if any note in this
+            # column started before it ends after it
+            nbr_ts = ts[nbr_mask]
+            num_started = np.searchsorted(col_ts, nbr_ts, side='left')
+
+            is_during_hold = (num_started > 0)
+            is_during_hold[is_during_hold] = col_te_max[num_started[is_during_hold] - 1] > nbr_ts[is_during_hold]
+
+            ret[nbr_mask] |= is_during_hold
 
-            # Check if any of the notes satisfy these conditions
-            ret[idx] |= np.any(data, axis=1)
-        
         return ret
 
 
@@ -204,38 +200,38 @@ class ManiaMapMetrics():
         if not np.any(hold_mask):
             return ret
 
-        # These indices will be uses as references as to where place data in ret
-        idx_ref = np.arange(action_data.shape[0])
+        # Convenience vars; only hold notes are considered
+        ts = action_data[hold_mask, ManiaActionData.IDX_STIME]  # Hold note start times
+        te = action_data[hold_mask, ManiaActionData.IDX_ETIME]  # Hold note end times
+        ky = action_data[hold_mask, ManiaActionData.IDX_COL]    # Hold note column
 
-        # Filter out non holds
-        idx_ref = idx_ref[hold_mask]
+        hold_ret = np.zeros(ts.shape[0], dtype=np.bool8)
 
-        # Convenience vars
-        ts = action_data[:, ManiaActionData.IDX_STIME]  # Hold note start times
-        te = action_data[:, ManiaActionData.IDX_ETIME]  # Hold note end times
-        ky = action_data[:, ManiaActionData.IDX_COL]    # Hold note column
+        for col in np.unique(ky):
+            col_mask = (ky == col)
+            nbr_mask = (np.abs(ky - col) == 1)
 
-        # Operate on data in chunks to limit memory usage when using meshgrid
-        for i in range(0, action_data.shape[0], 500):
-            # Get a chunk of data to operate on
-            idx_start = i
-            idx_end   = min(action_data.shape[0], i+1000)
-            idx = idx_ref[idx_start : idx_end]
+            # Holds in this column by start time, along with the latest end time of those started so far
+            col_sort = np.argsort(ts[col_mask], kind='stable')
+            col_ts = ts[col_mask][col_sort]
+            col_te_max = np.maximum.accumulate(te[col_mask][col_sort])
 
-            # Used to operate every note on every other note
-            a, b = np.meshgrid(idx, idx)
-            data = np.ones((idx.shape[0], idx.shape[0], ), dtype=np.bool8)
+            # Holds in neighboring columns that get released while a hold in this column is held
+            nbr_te = te[nbr_mask]
+            num_started = np.searchsorted(col_ts, nbr_te, side='left')
 
-            # Checks if note b's end time is between note a's start and end times 
-            data &= (ts[a] < te[b]) & (te[b] < te[a])
+            is_released = (num_started > 0)
+            is_released[is_released] = col_te_max[num_started[is_released] - 1] > nbr_te[is_released]
 
-            # Check if notes are neigboring and are not themselves
-            data &= np.abs(ky[a] - ky[b]) == 1
+            hold_ret[nbr_mask] |= is_released
 
-            # Check if any of the notes satisfy these conditions
-            # 0 and 1 axis are or'd to capture matches from both notes
-            ret[idx] |= np.any(data, axis=0) | np.any(data, axis=1)
+            # Holds in this column during which a hold in a neighboring column gets released
+            nbr_te = np.sort(nbr_te)
+            num_released = np.searchsorted(nbr_te, te[col_mask], side='left') - np.searchsorted(nbr_te, ts[col_mask], side='right')
 
+            hold_ret[col_mask] |= (num_released > 0)
+
+        ret[hold_mask] = hold_ret
         return ret
 
 
@@ -274,36 +270,36 @@ class ManiaMapMetrics():
         """
         ret = np.zeros((action_data.shape[0], ), dtype=np.bool8)
 
-        # These indices will be uses as references as to where place data in ret
-        idx_ref = np.arange(action_data.shape[0])
-
         # Convenience vars
         ts = action_data[:, ManiaActionData.IDX_STIME]  # Hold note start times
         te = action_data[:, ManiaActionData.IDX_ETIME]  # Hold note end times
         ky = action_data[:, ManiaActionData.IDX_COL]    # Hold note column
 
-        # Operate on data in chunks to limit memory usage when using meshgrid
-        for i in range(0, action_data.shape[0], 500):
-            # Get a chunk of data to operate on
-            idx_start = i
-            idx_end   = min(action_data.shape[0], i+1000)
-            idx = idx_ref[idx_start : idx_end]
+        for col in np.unique(ky):
+            col_mask = (ky == col)
+            col_ts = ts[col_mask]
+            col_te = te[col_mask]
 
-            # Used to operate every note on every other note
-            a, b = np.meshgrid(idx, idx, sparse=True)
-            data = np.ones((idx.shape[0], idx.shape[0], ), dtype=np.bool8)
+            # Notes in the other columns by start time
+            other_sort = np.argsort(ts[~col_mask], kind='stable')
+            other_ts = ts[~col_mask][other_sort]
+            other_te = te[~col_mask][other_sort]
 
-            # Check if note A ends before or at when note B ends
-            data &= te[a] <= te[b]
+            # Note is within some note in another column that starts at or before it and ends at or after it
+            other_te_max = np.maximum.accumulate(other_te)
+            num_started = np.searchsorted(other_ts, col_ts, side='right')
 
-            # Check if note A start after or at when note B starts
-            data &= ts[a] >= ts[b]
+            is_within = (num_started > 0)
+            is_within[is_within] = other_te_max[num_started[is_within] - 1] >= col_te[is_within]
 
-            # Check if notes A and B are on different columns
-            data &= ky[a] != ky[b]
+            # Note has within it some note in another column that starts at or after it and ends at or before it
+            other_te_min = np.minimum.accumulate(other_te[::-1])[::-1]
+            num_started = np.searchsorted(other_ts, col_ts, side='left')
 
-            # Check if any of the notes satisfy these conditions
-            ret[idx] |= np.any(data, axis=0) | np.any(data, axis=1)
+            has_within = (num_started < other_ts.shape[0])
+            has_within[has_within] = other_te_min[num_started[has_within]] <= col_te[has_within]
+
+            ret[col_mask] |= is_within | has_within
 
         return ret
 
@@ -523,36 +519,45 @@ class ManiaMapMetrics():
         te = action_data[:, ManiaActionData.IDX_ETIME]  # note end times
         ky = action_data[:, ManiaActionData.IDX_COL]    # note column
 
-        for i in range(action_data.shape[0]):
-            # Find notes that occur at same time as current note
-            # but at different column (to prevent same note matching)
-            chord = (ts == ts[i]) & (ky != ky[i])
-
-            # If no notes occur at this time, continue
-            if not np.any(chord): continue
-
-            # Column data for notes composing the chord 
-            # (excluding current note), rotated 90 deg for broadcasting
-            key_chord = ky[chord].reshape((ky[chord].shape[0], 1))
-    
-            # If applicable, find closest preceding notes
-            closest_prv = ts[ts[i] > ts]
-            if closest_prv.shape[0] != 0:
-                closest_prv = (ts == closest_prv[-1])
-
-                # One of prev notes must jack with one of the notes the chord consists of
-                if np.all(ky[closest_prv] != ky[i]) and np.all(ky[closest_prv] != key_chord): 
-                    continue
-
-            # If applicable, find closest leading notes
-            closest_nxt = ts[ts[i] < ts]
-            if closest_nxt.shape[0] != 0:
-                closest_nxt = (ts == closest_nxt[0])
-
-                # One of next notes must jack with one of the notes the chord consists of
-                if np.all(ky[closest_nxt] != ky[i]) and np.all(ky[closest_nxt] != key_chord): 
-                    continue
-            
-            ret[i] = 1
+        if action_data.shape[0] == 0:
+            return ret
+
+        # Group notes by start time. The conditions only depend on which columns are
+        # pressed at each time, so they are evaluated once per time group.
+        grp_times, grp_inv = np.unique(ts, return_inverse=True)
+        num_grps = grp_times.shape[0]
+
+        # Distinct (time group, column) pairs, encoded as one sortable key
+        _, col_inv = np.unique(ky, return_inverse=True)
+        num_cols   = int(col_inv.max()) + 1
+        grp_cols   = np.unique(grp_inv*num_cols + col_inv)
+        pair_grps  = grp_cols // num_cols
+        pair_cols  = grp_cols % num_cols
+
+        # Notes occur at the same time on different columns
+        is_chord = np.bincount(pair_grps, minlength=num_grps) >= 2
+
+        # Closest preceding and leading notes are the last and first notes in ``action_data`` that
+        # are earlier and later than the chord, respectively; Their time groups are the ones checked
+        idx_sort  = np.argsort(ts, kind='stable')
+        idx_first = np.searchsorted(ts[idx_sort], grp_times, side='left')
+        idx_last  = np.searchsorted(ts[idx_sort], grp_times, side='right')
+
+        has_prv = (idx_first > 0)
+        has_nxt = (idx_last < ts.shape[0])
+
+        prv_grps = np.zeros(num_grps, dtype=np.int64)
+        nxt_grps = np.zeros(num_grps, dtype=np.int64)
+        prv_grps[has_prv] = grp_inv[np.maximum.accumulate(idx_sort)[idx_first[has_prv] - 1]]
+        nxt_grps[has_nxt] = grp_inv[np.minimum.accumulate(idx_sort[::-1])[::-1][idx_last[has_nxt]]]
+
+        # One of the prev/next notes must jack with one of the notes the chord consists of
+        prv_jack = np.zeros(num_grps, dtype=np.bool8)
+        nxt_jack = np.zeros(num_grps, dtype=np.bool8)
+        prv_jack[pair_grps[np.isin(prv_grps[pair_grps]*num_cols + pair_cols, grp_cols)]] = True
+        nxt_jack[pair_grps[np.isin(nxt_grps[pair_grps]*num_cols + pair_cols, grp_cols)]] = True
+
+        is_chord &= (~has_prv | prv_jack) & (~has_nxt | nxt_jack)
+        ret[:] = is_chord[grp_inv]
 
         return ret
@@ -2,6 +2,7 @@ from enum import Enum
 import numpy as np
 import pandas as pd
 import scipy.stats
+import scipy.special
 import math
 
 from ..utils import prob_trials
@@ -25,6 +26,9 @@ class ManiaScoreData():
     __ADV_NOP = 0  # Used internal by scoring processor; Don't advance
     __ADV_MAP = 1  # Used internal by scoring processor; Advance timing
 
+    # OD8 hit windows (ms) for MAX, 300, 200, 100, and 50 judgements; Used by the model_* functions
+    __OD8_HIT_WINDOWS = np.asarray([ 16.5, 40.5, 73.5, 103.5, 127.5 ])
+
     TYPE_HITP  = 0  # A hit press has a hitobject and offset associated with it
     TYPE_HITR  = 1  # A hit release has a hitobject and offset associated with it
     TYPE_MISSP = 2  # A press miss has a hitobject associated with it, but not offset
@@ -436,10 +440,25 @@ class ManiaScoreData():
 
     @staticmethod
     def model_offset_prob(mean, stdev, offset):
-        prob_less_than_neg = scipy.stats.norm.cdf(-offset, loc=mean, scale=stdev)
-        prob_less_than_pos = scipy.stats.norm.cdf(offset, loc=mean, scale=stdev)
+        """
+        ``offset`` can be a scalar or an array of offsets, in which case the probability
+        of each is evaluated in one go
+        """
+        # Normal distribution is undefined for non-positive stdev
+        if not stdev > 0:
+            return np.nan if np.ndim(offset) == 0 else np.full(np.shape(offset), np.nan)
 
-        return prob_less_than_pos - prob_less_than_neg
+        z_pos = (np.asarray(offset) - mean)/stdev
+        z_neg = (-np.asarray(offset) - mean)/stdev
+
+        # ndtr is the standard normal cdf. When the whole range is above the mean, take the
+        # difference of the upper tails instead, which keeps precision for small probabilities.
+        prob = np.where(z_neg > 0,
+            scipy.special.ndtr(-z_neg) - scipy.special.ndtr(-z_pos),
+            scipy.special.ndtr(z_pos) - scipy.special.ndtr(z_neg)
+        )
+
+        return prob[()]
 
 
     @staticmethod
@@ -467,8 +486,9 @@ class ManiaScoreData():
         Returns: probability all random values [X] are between -offset <= X <= offset
                 TL;DR: look at all the hits for scores; What are the odds all of them are between -offset and offset?
         """
-        score_data = ManiaScoreData.filter_by_hit_type(score_data, [ManiaScoreData.TYPE_EMPTY], invert=True)
-        return ManiaScoreData.odds_some_tap_within(score_data, offset)**len(score_data)
+        # odds_some_tap_within filters out the empties itself, so only count the hits here
+        num_hits = int(np.count_nonzero(score_data['type'] != ManiaScoreData.TYPE_EMPTY))
+        return ManiaScoreData.odds_some_tap_within(score_data, offset)**num_hits
 
 
     @staticmethod
@@ -489,11 +509,8 @@ class ManiaScoreData():
         """
         Set for OD8
         """
-        prob_less_than_max  = ManiaScoreData.model_offset_prob(mean, stdev, 16.5)
-        prob_less_than_300  = ManiaScoreData.model_offset_prob(mean, stdev, 40.5)
-        prob_less_than_200  = ManiaScoreData.model_offset_prob(mean, stdev, 73.5)
-        prob_less_than_100  = ManiaScoreData.model_offset_prob(mean, stdev, 103.5)
-        prob_less_than_50   = ManiaScoreData.model_offset_prob(mean, stdev, 127.5)
+        prob_less_than_max, prob_less_than_300, prob_less_than_200, prob_less_than_100, prob_less_than_50 = \
+            ManiaScoreData.model_offset_prob(mean, stdev, ManiaScoreData.__OD8_HIT_WINDOWS)
 
         prob_max  = prob_less_than_max
         prob_300  = prob_less_than_300 - prob_max
@@ -522,11 +539,8 @@ class ManiaScoreData():
     @staticmethod
     def model_num_hits(mean, stdev, num_notes):
         # Calculate probabilities of hits being within offset of the resultant gaussian distribution
-        prob_less_than_max  = ManiaScoreData.model_offset_prob(mean, stdev, 16.5)
-        prob_less_than_300  = ManiaScoreData.model_offset_prob(mean, stdev, 40.5)
-        prob_less_than_200  = ManiaScoreData.model_offset_prob(mean, stdev, 73.5)
-        prob_less_than_100  = ManiaScoreData.model_offset_prob(mean, stdev, 103.5)
-        prob_less_than_50   = ManiaScoreData.model_offset_prob(mean, stdev, 127.5)
+        prob_less_than_max, prob_less_than_300, prob_less_than_200, prob_less_than_100, prob_less_than_50 = \
+            ManiaScoreData.model_offset_prob(mean, stdev, ManiaScoreData.__OD8_HIT_WINDOWS)
 
         prob_max  = prob_less_than_max
         prob_300  = prob_less_than_300 - prob_max
@@ -576,10 +590,8 @@ class ManiaScoreData():
         stdev = ManiaScoreData.tap_offset_stdev(score_data)
 
         # Get probabilites the number of score points are within hit window based on replay
-        prob_less_than_max = scipy.stats.binom.sf(num_max - 1, num_notes, ManiaScoreData.model_offset_prob(mean, stdev, 16.5))
-        prob_less_than_300 = scipy.stats.binom.sf(num_max + num_300 - 1, num_notes, ManiaScoreData.model_offset_prob(mean, stdev, 40.5))
-        prob_less_than_200 = scipy.stats.binom.sf(num_max + num_300 + num_200 - 1, num_notes, ManiaScoreData.model_offset_prob(mean, stdev, 73.5))
-        prob_less_than_100 = scipy.stats.binom.sf(num_max + num_300 + num_200 + num_100 - 1, num_notes, ManiaScoreData.model_offset_prob(mean, stdev, 103.5))
-        prob_less_than_50  = scipy.stats.binom.sf(num_max + num_300 + num_200 + num_100 + num_50 - 1, num_notes, ManiaScoreData.model_offset_prob(mean, stdev, 127.5))
+        num_within = np.cumsum([ num_max, num_300, num_200, num_100, num_50 ])
+        prob_within = ManiaScoreData.model_offset_prob(mean, stdev, ManiaScoreData.__OD8_HIT_WINDOWS)
+        prob_less_than = scipy.stats.binom.sf(num_within - 1, num_notes, prob_within)
 
-        return prob_less_than_max*prob_less_than_300*prob_less_than_200*prob_less_than_100*prob_less_than_50
+        return np.prod(prob_less_than)
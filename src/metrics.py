@@ -5,7 +5,7 @@ class Metrics():
 
     @staticmethod
     def dists(x, y):
-        return np.sqrt(np.diff(x)**2 + np.diff(y)**2)
+        return np.hypot(np.diff(x), np.diff(y))
 
 
     @staticmethod
@@ -117,12 +117,14 @@ class Metrics():
         r = Metrics.inv_curv(x, y, t)
         cent_accel = Metrics.cent_accel(x, y, t)
 
+        dist = np.hypot(dx, dy)
+
         # Center of circle making the curve
-        px = x[1:] + (r*dy)/np.sqrt(dx**2 + dy**2)
-        py = y[1:] + (r*dx)/np.sqrt(dx**2 + dy**2)
+        px = x[1:] + (r*dy)/dist
+        py = y[1:] + (r*dx)/dist
 
         # Normalized acceleration vector
-        acx = cent_accel*(px/np.sqrt(dx**2 + dy**2))
-        acy = cent_accel*(py/np.sqrt(dx**2 + dy**2))
+        acx = cent_accel*(px/dist)
+        acy = cent_accel*(py/dist)
 
         return Metrics.inst_ang_vel(acx, acy, t[1:])
\ No newline at end of file
@@ -14,6 +14,28 @@ class StdMapPatterns():
         Undocumented functions in this class are not supported and are experimental.
     """
     
+    @staticmethod
+    def __get_press_release_values(map_data):
+        """
+        Gets the press and release aimpoints of every hitobject as arrays, reading
+        the map data's values only once
+
+        Parameters
+        ----------
+        map_data : numpy.array
+            Map data to operate on
+
+        Returns
+        -------
+        (numpy.array, numpy.array)
+            Press aimpoints and release aimpoints
+        """
+        map_values = map_data.values
+        map_types  = map_values[:, StdMapData.IDX_TYPE]
+
+        return map_values[map_types == StdMapData.TYPE_PRESS], map_values[map_types == StdMapData.TYPE_RELEASE]
+
+
     @staticmethod
     def detect_short_sliders_dist(map_data, cs_px):
         """
@@ -38,9 +60,12 @@ class StdMapPatterns():
             ::
                 [ bool, bool, bool ]
         """
-        presses = StdMapData.get_presses(map_data).values
-        releases = StdMapData.get_releases(map_data).values
+        presses, releases = StdMapPatterns.__get_press_release_values(map_data)
+        return StdMapPatterns.__short_sliders_dist(presses, releases, cs_px)
+
 
+    @staticmethod
+    def __short_sliders_dist(presses, releases, cs_px):
         # TODO: Aimpoints in between slider ends are being ignored. That can make a long slider
         # marked as a short one. This function was inteaded to be used to determine whether to
         # take hitobject's starting time or ending time, but this complicates things. Aimpoints need
@@ -52,7 +77,7 @@ class StdMapPatterns():
         ys = presses[:, StdMapData.IDX_Y]
         ye = releases[:, StdMapData.IDX_Y]
 
-        dists = lambda xs, xe, ys, ye: np.sqrt((xe - xs)**2 + (ye - ys)**2)
+        dists = lambda xs, xe, ys, ye: np.hypot(xe - xs, ye - ys)
         return dists(xs, xe, ys, ye) < cs_px
 
 
@@ -80,9 +105,12 @@ class StdMapPatterns():
             ::
                 [ bool, bool, bool ]
         """
-        presses = StdMapData.get_presses(map_data).values
-        releases = StdMapData.get_releases(map_data).values
+        presses, releases = StdMapPatterns.__get_press_release_values(map_data)
+        return StdMapPatterns.__short_sliders_time(presses, releases, min_time)
+
 
+    @staticmethod
+    def __short_sliders_time(presses, releases, min_time):
         return ((releases[:, StdMapData.IDX_TIME] - presses[:, StdMapData.IDX_TIME]) < min_time)
 
 
@@ -116,8 +144,11 @@ class StdMapPatterns():
                     ... N aimpoints
                 ]
         """
-        is_short_sliders_time = StdMapPatterns.detect_short_sliders_time(map_data, min_time)
-        is_short_sliders_dist = StdMapPatterns.detect_short_sliders_dist(map_data, cs_px)
+        # Both checks work on the same slider ends, so only extract them once
+        presses, releases = StdMapPatterns.__get_press_release_values(map_data)
+
+        is_short_sliders_time = StdMapPatterns.__short_sliders_time(presses, releases, min_time)
+        is_short_sliders_dist = StdMapPatterns.__short_sliders_dist(presses, releases, cs_px)
 
         map_data = map_data.copy()
 
@@ -169,8 +169,38 @@ class StdReplayData():
         numpy.array
         Reduced replay data
         """
-        # Score data that will be filled in and returned
-        new_data = {}
+        replay_times, replay_xposs, replay_yposs, replay_keys = StdReplayData.get_reduced_replay_data_ndarray(replay_data, press_block, release_block, reduce_data)
+
+        # Convert recorded timings and states into a pandas data
+        return pd.DataFrame({
+            'time' : replay_times,
+            'x'    : replay_xposs,
+            'y'    : replay_yposs,
+            'k'    : replay_keys.astype(np.float64),
+        })
+
+
+    @staticmethod
+    def get_reduced_replay_data_ndarray(replay_data, press_block=True, release_block=False, reduce_data=False):
+        """
+        Same as ``StdReplayData.get_reduced_replay_data``, but returns the columns
+        as separate arrays instead of building a dataframe out of them
+
+        Parameters
+        ----------
+        replay_data : numpy.array
+            Action data from ``StdReplayData.get_replay_data``
+
+        Returns
+        -------
+        (numpy.array, numpy.array, numpy.array, numpy.array)
+            Times, x positions, y positions, and merged key states of the reduced replay data
+        """
+        # Reduced replay data that will be filled in and returned
+        new_times = []
+        new_xposs = []
+        new_yposs = []
+        new_keys  = []
 
         # Reducing replay data removes frames where there are no button transitions
         if reduce_data:
@@ -180,6 +210,11 @@ class StdReplayData():
         replay_data = replay_data.values
         num_replay_events = len(replay_data)
 
+        replay_times = replay_data[:, 0].tolist()
+        replay_xposs = replay_data[:, 1].tolist()
+        replay_yposs = replay_data[:, 2].tolist()
+        replay_keyss = replay_data[:, 3:7]
+
         # replay pointer
         replay_idx = 0
 
@@ -193,10 +228,10 @@ class StdReplayData():
                 break
 
             # Data for this event frame
-            replay_time = replay_data[replay_idx][0]    # time
-            replay_xpos = replay_data[replay_idx][1]    # x
-            replay_ypos = replay_data[replay_idx][2]    # y
-            replay_keys = replay_data[replay_idx][3:7]  # keys
+            replay_time = replay_times[replay_idx]
+            replay_xpos = replay_xposs[replay_idx]
+            replay_ypos = replay_yposs[replay_idx]
+            replay_keys = replay_keyss[replay_idx]
 
             new_key_state = StdReplayData.__get_key_state(key_state, replay_keys, press_block, release_block)
 
@@ -205,7 +240,10 @@ class StdReplayData():
 
             if key_state != new_key_state:
                 if key_state == StdReplayData.HOLD and new_key_state == StdReplayData.PRESS:
-                    new_data[len(new_data)] = np.asarray([ replay_time - 1, replay_xpos, replay_ypos, StdReplayData.RELEASE ])
+                    new_times.append(replay_time - 1)
+                    new_xposs.append(replay_xpos)
+                    new_yposs.append(replay_ypos)
+                    new_keys.append(StdReplayData.RELEASE)
 
             # It's possible to trigger two PRESSES/RELEASES in a row if left/right keys happen to press/release one frame after another
             if key_state == StdReplayData.PRESS and new_key_state == StdReplayData.PRESS:
@@ -215,11 +253,17 @@ class StdReplayData():
             else:
                 key_state = new_key_state
 
-            new_data[len(new_data)] = np.asarray([ replay_time, replay_xpos, replay_ypos, new_key_state ])
-
-        # Convert recorded timings and states into a pandas data
-        new_data = list(new_data.values())
-        return pd.DataFrame(new_data, columns=[ 'time', 'x', 'y', 'k' ])
+            new_times.append(replay_time)
+            new_xposs.append(replay_xpos)
+            new_yposs.append(replay_ypos)
+            new_keys.append(new_key_state)
+
+        return (
+            np.asarray(new_times, dtype=np.float64),
+            np.asarray(new_xposs, dtype=np.float64),
+            np.asarray(new_yposs, dtype=np.float64),
+            np.asarray(new_keys,  dtype=np.int8),
+        )
 
 
     @staticmethod
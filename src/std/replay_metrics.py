@@ -31,7 +31,7 @@ class StdReplayMetrics():
         all_times = replay_data[:, 0]
         if len(all_times) < 2: return [], []
         
-        vels = np.sqrt(np.diff(replay_data[:, 1])**2 + np.diff(replay_data[:, 2])**2)/np.diff(all_times)
+        vels = np.hypot(np.diff(replay_data[:, 1]), np.diff(replay_data[:, 2]))/np.diff(all_times)
         return all_times[2:], vels[1:]
 
 
@@ -1,7 +1,11 @@
 from enum import Enum
+from collections import namedtuple
+import bisect
+import math
 import numpy as np
 import pandas as pd
 import scipy.stats
+import scipy.special
 
 from .map_data import StdMapData
 from .replay_data import StdReplayData
@@ -42,6 +46,18 @@ class StdScoreData():
     DATA_TYPE    = 1
     DATA_MAP_IDX = 2
 
+    # Column dtypes of the DataFrame returned by `get_score_data`
+    _OUT_DTYPES = {
+        'replay_t' : np.int32,
+        'map_t'    : np.float32,  # NaN for empty presses
+        'replay_x' : np.float32,
+        'replay_y' : np.float32,
+        'map_x'    : np.float32,
+        'map_y'    : np.float32,
+        'type'     : np.int8,
+        'action'   : np.int8,
+    }
+
     class Settings():
 
         def __setattr__(self, key, value):
@@ -252,248 +268,414 @@ class StdScoreData():
             self.__is_frozen = True
 
 
+    # Read-only snapshot of the settings scoring processors use; see `__freeze_settings`
+    __PROC_SETTINGS_FIELDS = [
+        'neg_hit_miss_range', 'neg_hit_range', 'pos_hit_range', 'pos_hit_miss_range',
+        'neg_rel_miss_range', 'neg_rel_range', 'pos_rel_range', 'pos_rel_miss_range',
+        'neg_hld_range',      'pos_hld_range',
+        'hitobject_radius',   'release_radius', 'follow_radius',
+        'blank_miss',         'recoverable_release', 'release_miss', 'miss_slider', 'press_miss', 'recoverable_missaim',
+        'require_tap_press',  'require_tap_release', 'require_tap_hold',
+        'require_aim_press',  'require_aim_release', 'require_aim_hold',
+    ]
+
+    # The settings above plus values derived from them once per play
+    __ProcSettings = namedtuple('ProcSettings', __PROC_SETTINGS_FIELDS + [
+        'hit_bounds', 'rel_bounds',
+        'hitobject_radius_sq', 'release_radius_sq', 'follow_radius_sq',
+    ])
+
+    # Timing windows the sorted window bounds split time offsets into; see `__timing_window`
+    __WINDOW_NEG_NOTHING = 0
+    __WINDOW_NEG_MISS    = 1
+    __WINDOW_HIT         = 2
+    __WINDOW_POS_MISS    = 3
+    __WINDOW_POS_NOTHING = 4
+    __WINDOW_NONE        = -1  # A NaN offset is in no window, so the processors do nothing for it
+
+
+    class _ScoreBuf():
+        """
+        Column buffers the scoring processors record score data rows into.
+        `n` is the number of rows recorded so far.
+
+        Every row is recorded either by the processor handling a replay frame,
+        which records at most one row per frame, or together with advancing past
+        at least one aimpoint. So a play never records more than
+        ``num_replay_frames + num_aimpoints`` rows, and sizing the buffer to that
+        means it never has to grow.
+        """
+
+        def __init__(self, size):
+            size = max(size, 1)
+
+            # Columns are stored in the dtypes `get_score_data` returns them in
+            out_dtypes = StdScoreData._OUT_DTYPES
+
+            self.n        = 0
+            self.replay_t = np.empty(size, dtype=out_dtypes['replay_t'])
+            self.map_t    = np.empty(size, dtype=out_dtypes['map_t'])
+            self.replay_x = np.empty(size, dtype=out_dtypes['replay_x'])
+            self.replay_y = np.empty(size, dtype=out_dtypes['replay_y'])
+            self.map_x    = np.empty(size, dtype=out_dtypes['map_x'])
+            self.map_y    = np.empty(size, dtype=out_dtypes['map_y'])
+            self.type     = np.empty(size, dtype=out_dtypes['type'])
+            self.action   = np.empty(size, dtype=out_dtypes['action'])
+
+
+        def __len__(self):
+            return self.n
+
+
+        def push(self, replay_t, map_t, replay_x, replay_y, map_x, map_y, type, action):
+            i = self.n
+            self.replay_t[i] = replay_t
+            self.map_t[i]    = map_t
+            self.replay_x[i] = replay_x
+            self.replay_y[i] = replay_y
+            self.map_x[i]    = map_x
+            self.map_y[i]    = map_y
+            self.type[i]     = type
+            self.action[i]   = action
+            self.n = i + 1
+
+
     @staticmethod
-    def __adv(map_data, map_time, adv):
-        if adv == StdScoreData.__ADV_NOP:
-            return map_time
+    def __freeze_settings(settings):
+        """
+        Copies the settings used by the scoring processors into an immutable tuple of
+        plain python floats and bools so they are read once per play rather than looked
+        up on the `Settings` object for every replay frame.
+        """
+        values = {}
+        for field in StdScoreData.__PROC_SETTINGS_FIELDS:
+            value = getattr(settings, field)
+            values[field] = value if isinstance(value, bool) else float(value)
+
+        values['hit_bounds'] = ( -values['neg_hit_miss_range'], -values['neg_hit_range'], values['pos_hit_range'], values['pos_hit_miss_range'] )
+        values['rel_bounds'] = ( -values['neg_rel_miss_range'], -values['neg_rel_range'], values['pos_rel_range'], values['pos_rel_miss_range'] )
+
+        # Aim checks compare squared distances, so no square root is needed per frame
+        values['hitobject_radius_sq'] = values['hitobject_radius']**2
+        values['release_radius_sq']   = values['release_radius']**2
+        values['follow_radius_sq']    = values['follow_radius']**2
+
+        return StdScoreData.__ProcSettings(**values)
+
+
+    @staticmethod
+    def __timing_window(bounds, time_offset):
+        """
+        Returns which of the ``__WINDOW_*`` timing windows ``time_offset`` falls in.
+
+        ``bounds`` are the sorted ``( -neg_miss_range, -neg_range, pos_range, pos_miss_range )``
+        window edges. Each window excludes its lower edge and includes its upper edge, which
+        is what a left bisection of the edges counts. A NaN ``time_offset`` compares false
+        against every edge, so it gets ``__WINDOW_NONE`` rather than whatever the bisection
+        lands on.
+        """
+        if time_offset != time_offset:
+            return StdScoreData.__WINDOW_NONE
+
+        return bisect.bisect_left(bounds, time_offset)
+
+
+    @staticmethod
+    def __adv_tables(map_values):
+        """
+        Precomputes the index ``__adv`` returns for every aimpoint, so advancing
+        during the scoring loop is a lookup rather than a scan over the map.
+
+        Returns
+        -------
+        (list, list)
+            Index of the next aimpoint and of the next note for each aimpoint. Each has
+            one extra trailing entry for an exhausted map, whose index is the number of
+            aimpoints and whose time is 1 ms past the last listed aimpoint.
+        """
+        map_times = map_values[:, StdMapData.IDX_TIME]
+        num_aimpoints = map_times.shape[0]
+
+        # An exhausted map is at the time right after the last listed aimpoint. A slider
+        # overlapping the last listed note can still have aimpoints after that time, so
+        # advancing from there is looked up by time like from any other aimpoint.
+        from_times = np.append(map_times, map_times[-1] + 1)
+
+        # First listed aimpoint with a later time. Aimpoints of overlapping hitobjects are
+        # not in time order, but the running max of the times first exceeds some time exactly
+        # at the first aimpoint whose time exceeds it.
+        next_aimp = np.searchsorted(np.maximum.accumulate(map_times), from_times, side='right')
+
+        # Same, but only considering note presses
+        press_times = np.where(map_values[:, StdMapData.IDX_TYPE] == StdMapData.TYPE_PRESS, map_times, -np.inf)
+        next_note = np.searchsorted(np.maximum.accumulate(press_times), from_times, side='right')
+
+        # Overlapping hitobjects may have an aimpoint at the same time listed before the note
+        unique_times, first_idxs = np.unique(map_times, return_index=True)
+        found = (next_note < num_aimpoints)
+        next_note[found] = first_idxs[np.searchsorted(unique_times, map_times[next_note[found]])]
+
+        return next_aimp.tolist(), next_note.tolist()
 
+
+    @staticmethod
+    def __adv(adv_tables, map_idx, adv):
+        """
+        Returns the index of the aimpoint to process next. Returns the number of
+        aimpoints if there are no more aimpoints to advance to.
+
+        ``adv_tables`` is what ``__adv_tables`` returns for the map.
+        """
         if adv == StdScoreData.__ADV_AIMP:
-            aimpoint = StdMapData.get_scorepoint_after(map_data, map_time)
-            if type(aimpoint) == type(None): 
-                return StdMapData.all_times(map_data)[-1] + 1
-            
-            return aimpoint['time']
+            return adv_tables[0][map_idx]
 
         if adv == StdScoreData.__ADV_NOTE:
-            note = StdMapData.get_note_after(map_data, map_time)
-            if type(note) == type(None):
-                return StdMapData.all_times(map_data)[-1] + 1
-            return note['time'][0]
+            return adv_tables[1][map_idx]
 
-        return map_time
+        return map_idx
 
 
     @staticmethod
-    def __process_free(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
-        # Note start and end params
-        aimpoint_time = aimpoints[0][0]  # time
-        aimpoint_xcor = aimpoints[0][1]  # x
-        aimpoint_ycor = aimpoints[0][2]  # y
-        aimpoint_type = aimpoints[0][3]  # type
-
+    def __process_free(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos):
         # Free only looks at timings that have passed
-        if replay_time < aimpoint_time:
+        if time_offset < 0:
             return StdScoreData.__ADV_NOP
 
-        time_offset = replay_time - aimpoint_time
-        posx_offset = replay_xpos - aimpoint_xcor
-        posy_offset = replay_ypos - aimpoint_ycor
-        pos_offset  = (posx_offset**2 + posy_offset**2)**0.5
-
-        def proc_press():
-            is_late_timing = time_offset > settings.pos_hit_miss_range
-            is_miss_aiming = pos_offset > settings.hitobject_radius
-
-            if settings.require_aim_press and settings.require_tap_press:
-                if is_miss_aiming:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, last_tap_pos[0], last_tap_pos[1], aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
-                else:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, last_tap_pos[0], last_tap_pos[1], aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
-
-            if settings.require_aim_press and not settings.require_tap_press:
-                if is_miss_aiming:
-                    if is_late_timing:
-                        print(f'free miss | replay_time: {replay_time}    aimpoint_time: {aimpoint_time}   time_offset: {time_offset}')
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, replay_xpos, replay_ypos, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
+        aimpoint_type = aimpoint[3]  # type
+
+        if aimpoint_type == StdMapData.TYPE_PRESS:   return StdScoreData.__process_free_press(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
+        if aimpoint_type == StdMapData.TYPE_RELEASE: return StdScoreData.__process_free_release(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
+        if aimpoint_type == StdMapData.TYPE_HOLD:    return StdScoreData.__process_free_hold(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
+
+        # Unknown aimpoint type; skip
+        return StdScoreData.__ADV_NOTE
+
+
+    @staticmethod
+    def __process_free_press(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos):
+        aimpoint_time = aimpoint[0]  # time
+        aimpoint_xcor = aimpoint[1]  # x
+        aimpoint_ycor = aimpoint[2]  # y
+
+        require_aim_press = settings.require_aim_press
+        require_tap_press = settings.require_tap_press
+
+        is_late_timing = time_offset > settings.pos_hit_miss_range
+        radius = settings.hitobject_radius
+        if posx_offset > radius or posx_offset < -radius or posy_offset > radius or posy_offset < -radius:
+            is_miss_aiming = True
+        else:
+            is_miss_aiming = (posx_offset*posx_offset + posy_offset*posy_offset) > settings.hitobject_radius_sq
+
+        if require_aim_press and require_tap_press:
+            if is_miss_aiming:
+                if is_late_timing:
+                    score_data.push(replay_time, aimpoint_time, last_tap_pos[0], last_tap_pos[1], aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS)
+                    return StdScoreData.__ADV_NOTE
                 else:
-                    if time_offset >= 0:
-                        print(f'free hitp | replay_time: {replay_time}    aimpoint_time: {aimpoint_time}   time_offset: {time_offset}')
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, replay_xpos, replay_ypos, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITP, StdReplayData.PRESS ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
-
-            if not settings.require_aim_press and settings.require_tap_press:
+                    return StdScoreData.__ADV_NOP
+            else:
                 if is_late_timing:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, last_tap_pos[0], last_tap_pos[1], aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS ])
+                    score_data.push(replay_time, aimpoint_time, last_tap_pos[0], last_tap_pos[1], aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS)
                     return StdScoreData.__ADV_NOTE
                 else:
                     return StdScoreData.__ADV_NOP
 
-            if not settings.require_aim_press and not settings.require_tap_press:
+        if require_aim_press and not require_tap_press:
+            if is_miss_aiming:
+                if is_late_timing:
+                    score_data.push(replay_time, aimpoint_time, replay_xpos, replay_ypos, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS)
+                    return StdScoreData.__ADV_NOTE
+                else:
+                    return StdScoreData.__ADV_NOP
+            else:
                 if time_offset >= 0:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, aimpoint_xcor, aimpoint_ycor, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITP, StdReplayData.PRESS ])
+                    score_data.push(replay_time, aimpoint_time, replay_xpos, replay_ypos, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITP, StdReplayData.PRESS)
                     return StdScoreData.__ADV_NOTE
                 else:
                     return StdScoreData.__ADV_NOP
 
-            return StdScoreData.__ADV_NOP
-            
-        def proc_release():
-            rec_x, rec_y = (replay_xpos, replay_ypos) if settings.require_aim_release else ( \
-                (aimpoint_xcor, aimpoint_ycor)
-            )
-
-            is_late_timing = time_offset > settings.pos_rel_miss_range
-            is_miss_aiming = pos_offset > settings.release_radius
-
-            if settings.require_aim_release and settings.require_tap_release:
-                if is_miss_aiming:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
+        if not require_aim_press and require_tap_press:
+            if is_late_timing:
+                score_data.push(replay_time, aimpoint_time, last_tap_pos[0], last_tap_pos[1], aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS)
+                return StdScoreData.__ADV_NOTE
+            else:
+                return StdScoreData.__ADV_NOP
+
+        if not require_aim_press and not require_tap_press:
+            if time_offset >= 0:
+                score_data.push(replay_time, aimpoint_time, aimpoint_xcor, aimpoint_ycor, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITP, StdReplayData.PRESS)
+                return StdScoreData.__ADV_NOTE
+            else:
+                return StdScoreData.__ADV_NOP
+
+        return StdScoreData.__ADV_NOP
+
+
+    @staticmethod
+    def __process_free_release(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos):
+        aimpoint_time = aimpoint[0]  # time
+        aimpoint_xcor = aimpoint[1]  # x
+        aimpoint_ycor = aimpoint[2]  # y
+
+        require_aim_release = settings.require_aim_release
+        require_tap_release = settings.require_tap_release
+
+        if require_aim_release:
+            rec_x = replay_xpos
+            rec_y = replay_ypos
+        else:
+            rec_x = aimpoint_xcor
+            rec_y = aimpoint_ycor
+
+        is_late_timing = time_offset > settings.pos_rel_miss_range
+        radius = settings.release_radius
+        if posx_offset > radius or posx_offset < -radius or posy_offset > radius or posy_offset < -radius:
+            is_miss_aiming = True
+        else:
+            is_miss_aiming = (posx_offset*posx_offset + posy_offset*posy_offset) > settings.release_radius_sq
+
+        if require_aim_release and require_tap_release:
+            if is_miss_aiming:
+                if is_late_timing:
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE)
+                    return StdScoreData.__ADV_NOTE
                 else:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
-
-            if settings.require_aim_release and not settings.require_tap_release:
-                if is_miss_aiming:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
+                    return StdScoreData.__ADV_NOP
+            else:
+                if is_late_timing:
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE)
+                    return StdScoreData.__ADV_NOTE
                 else:
-                    if time_offset >= 0:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITR, StdReplayData.RELEASE ])
-                        return StdScoreData.__ADV_NOTE
-                    else:
-                        return StdScoreData.__ADV_NOP
+                    return StdScoreData.__ADV_NOP
 
-            if not settings.require_aim_release and settings.require_tap_release:
+        if require_aim_release and not require_tap_release:
+            if is_miss_aiming:
                 if is_late_timing:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE ])
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE)
                     return StdScoreData.__ADV_NOTE
                 else:
                     return StdScoreData.__ADV_NOP
-
-            if not settings.require_aim_release and not settings.require_tap_release:
+            else:
                 if time_offset >= 0:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITR, StdReplayData.RELEASE ])
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITR, StdReplayData.RELEASE)
                     return StdScoreData.__ADV_NOTE
                 else:
                     return StdScoreData.__ADV_NOP
 
-        def proc_hold():
-            if settings.recoverable_release:
-                is_late_timing = time_offset > settings.pos_hld_range
+        if not require_aim_release and require_tap_release:
+            if is_late_timing:
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE)
+                return StdScoreData.__ADV_NOTE
             else:
-                is_late_timing = time_offset > 0
+                return StdScoreData.__ADV_NOP
+
+        if not require_aim_release and not require_tap_release:
+            if time_offset >= 0:
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITR, StdReplayData.RELEASE)
+                return StdScoreData.__ADV_NOTE
+            else:
+                return StdScoreData.__ADV_NOP
+
 
-            is_miss_aiming = pos_offset > settings.release_radius
+    @staticmethod
+    def __process_free_hold(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos):
+        aimpoint_time = aimpoint[0]  # time
+        aimpoint_xcor = aimpoint[1]  # x
+        aimpoint_ycor = aimpoint[2]  # y
+
+        require_aim_hold = settings.require_aim_hold
+        require_tap_hold = settings.require_tap_hold
 
-            rec_x, rec_y = (replay_xpos, replay_ypos) if settings.require_aim_hold else ( \
-                (aimpoint_xcor, aimpoint_ycor)
-            )
+        if settings.recoverable_release:
+            is_late_timing = time_offset > settings.pos_hld_range
+        else:
+            is_late_timing = time_offset > 0
+
+        radius = settings.release_radius
+        if posx_offset > radius or posx_offset < -radius or posy_offset > radius or posy_offset < -radius:
+            is_miss_aiming = True
+        else:
+            is_miss_aiming = (posx_offset*posx_offset + posy_offset*posy_offset) > settings.release_radius_sq
 
-            if settings.require_aim_hold and settings.require_tap_hold:
-                if is_miss_aiming:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD ])
-                        return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
-                    else:
-                        return StdScoreData.__ADV_NOP
+        if require_aim_hold:
+            rec_x = replay_xpos
+            rec_y = replay_ypos
+        else:
+            rec_x = aimpoint_xcor
+            rec_y = aimpoint_ycor
+
+        if require_aim_hold and require_tap_hold:
+            if is_miss_aiming:
+                if is_late_timing:
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD)
+                    return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
                 else:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD ])
-                        return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
-                    else:
-                        return StdScoreData.__ADV_NOP
-
-            if settings.require_aim_hold and not settings.require_tap_hold:
-                if is_miss_aiming:
-                    if is_late_timing:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD ])
-                        return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
-                    else:
-                        return StdScoreData.__ADV_NOP
+                    return StdScoreData.__ADV_NOP
+            else:
+                if is_late_timing:
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD)
+                    return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
                 else:
-                    if time_offset >= 0:
-                        score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_AIMH, StdReplayData.HOLD ])
-                        return StdScoreData.__ADV_AIMP
-                    else:
-                        return StdScoreData.__ADV_NOP
+                    return StdScoreData.__ADV_NOP
 
-            if not settings.require_aim_hold and settings.require_tap_hold:
+        if require_aim_hold and not require_tap_hold:
+            if is_miss_aiming:
                 if is_late_timing:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD ])
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD)
                     return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
                 else:
                     return StdScoreData.__ADV_NOP
-
-            if not settings.require_aim_hold and not settings.require_tap_hold:
+            else:
                 if time_offset >= 0:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_AIMH, StdReplayData.HOLD ])
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_AIMH, StdReplayData.HOLD)
                     return StdScoreData.__ADV_AIMP
                 else:
                     return StdScoreData.__ADV_NOP
 
-        if aimpoint_type == StdMapData.TYPE_PRESS:   return proc_press()
-        if aimpoint_type == StdMapData.TYPE_RELEASE: return proc_release()
-        if aimpoint_type == StdMapData.TYPE_HOLD:    return proc_hold()
+        if not require_aim_hold and require_tap_hold:
+            if is_late_timing:
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD)
+                return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
+            else:
+                return StdScoreData.__ADV_NOP
 
-        # Unknown aimpoint type; skip
-        return StdScoreData.__ADV_NOTE
+        if not require_aim_hold and not require_tap_hold:
+            if time_offset >= 0:
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_AIMH, StdReplayData.HOLD)
+                return StdScoreData.__ADV_AIMP
+            else:
+                return StdScoreData.__ADV_NOP
 
 
     @staticmethod
-    def __process_press(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
+    def __process_press(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos):
         # Note start and end params
-        aimpoint_time = aimpoints[0][0]  # time
-        aimpoint_xcor = aimpoints[0][1]  # x
-        aimpoint_ycor = aimpoints[0][2]  # y
-        aimpoint_type = aimpoints[0][3]  # type
-        aimpoint_obj  = aimpoints[0][4]  # object
+        aimpoint_time = aimpoint[0]  # time
+        aimpoint_xcor = aimpoint[1]  # x
+        aimpoint_ycor = aimpoint[2]  # y
+        aimpoint_type = aimpoint[3]  # type
+        aimpoint_obj  = aimpoint[4]  # object
 
         # If it's not a press scorepoint, ignore
         if aimpoint_type != StdMapData.TYPE_PRESS:
             return StdScoreData.__ADV_NOP
 
-        time_offset = replay_time - aimpoint_time
-        posx_offset = replay_xpos - aimpoint_xcor
-        posy_offset = replay_ypos - aimpoint_ycor
-        pos_offset  = (posx_offset**2 + posy_offset**2)**0.5
-
         if settings.require_aim_press:
-            is_miss_aim = pos_offset > settings.hitobject_radius
+            radius = settings.hitobject_radius
+            if posx_offset > radius or posx_offset < -radius or posy_offset > radius or posy_offset < -radius:
+                is_miss_aim = True
+            else:
+                is_miss_aim = (posx_offset*posx_offset + posy_offset*posy_offset) > settings.hitobject_radius_sq
             rec_x, rec_y = replay_xpos, replay_ypos
         else:
             is_miss_aim = False
             rec_x, rec_y = aimpoint_xcor, aimpoint_ycor
 
-        if settings.require_tap_press:
-            is_in_neg_nothing_range =                                time_offset <= -settings.neg_hit_miss_range
-            is_in_neg_miss_range    = -settings.neg_hit_miss_range < time_offset <= -settings.neg_hit_range
-            is_in_hit_range         = -settings.neg_hit_range      < time_offset <=  settings.pos_hit_range
-            is_in_pos_miss_range    =  settings.pos_hit_range      < time_offset <=  settings.pos_hit_miss_range
-            is_in_pos_nothing_range =  settings.pos_hit_miss_range < time_offset
-        else:
-            is_in_neg_nothing_range = settings.blank_miss and (time_offset <= -settings.neg_hit_miss_range)
-            is_in_neg_miss_range    = False
-            is_in_hit_range         = time_offset >= 0
-            is_in_pos_miss_range    = False
-            is_in_pos_nothing_range = False
-
         if is_miss_aim:
             # If blank miss is on, then record misses due to pressing in empty space
             if settings.blank_miss:
-                score_data[len(score_data)] = np.asarray([ replay_time, np.nan, replay_xpos, replay_ypos, np.nan, np.nan, StdScoreData.TYPE_EMPTY, StdReplayData.PRESS ])
+                score_data.push(replay_time, np.nan, replay_xpos, replay_ypos, np.nan, np.nan, StdScoreData.TYPE_EMPTY, StdReplayData.PRESS)
             
             # Record the position in black area the player tapped at
             last_tap_pos[0] = replay_xpos
@@ -502,33 +684,42 @@ class StdScoreData():
             # No note was hit, so don't go to next
             return StdScoreData.__ADV_NOP
 
-        if is_in_neg_nothing_range:
+        if settings.require_tap_press:
+            window = StdScoreData.__timing_window(settings.hit_bounds, time_offset)
+        elif settings.blank_miss and (time_offset <= -settings.neg_hit_miss_range):
+            window = StdScoreData.__WINDOW_NEG_NOTHING
+        elif time_offset >= 0:
+            window = StdScoreData.__WINDOW_HIT
+        else:
+            window = StdScoreData.__WINDOW_POS_NOTHING
+
+        if window == StdScoreData.__WINDOW_NEG_NOTHING:
             if settings.blank_miss:
-                score_data[len(score_data)] = np.asarray([ replay_time, np.nan, rec_x, rec_y, np.nan, np.nan, StdScoreData.TYPE_EMPTY, StdReplayData.PRESS ])
+                score_data.push(replay_time, np.nan, rec_x, rec_y, np.nan, np.nan, StdScoreData.TYPE_EMPTY, StdReplayData.PRESS)
             return StdScoreData.__ADV_NOP
 
-        if is_in_neg_miss_range:
+        if window == StdScoreData.__WINDOW_NEG_MISS:
             if settings.press_miss:
-                score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS ])
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS)
                 return StdScoreData.__ADV_NOTE
             else:
                 return StdScoreData.__ADV_NOP
 
-        if is_in_hit_range:            
-            score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITP, StdReplayData.PRESS ])
+        if window == StdScoreData.__WINDOW_HIT:
+            score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITP, StdReplayData.PRESS)
             if aimpoint_obj == StdMapData.TYPE_SLIDER:
                 return StdScoreData.__ADV_AIMP
             else:
                 return StdScoreData.__ADV_NOTE
 
-        if is_in_pos_miss_range:
+        if window == StdScoreData.__WINDOW_POS_MISS:
             if settings.press_miss:
-                score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS ])
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.PRESS)
                 return StdScoreData.__ADV_NOTE
             else:
                 return StdScoreData.__ADV_NOP
 
-        if is_in_pos_nothing_range:
+        if window == StdScoreData.__WINDOW_POS_NOTHING:
             # Way late taps, interpret as never pressed.
             # Ignore these and let FREE processing handle it.
             return StdScoreData.__ADV_NOP
@@ -537,33 +728,35 @@ class StdScoreData():
 
 
     @staticmethod
-    def __process_hold(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
+    def __process_hold(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos):
         # Note start and end params
-        aimpoint_time = aimpoints[0][0]  # time
-        aimpoint_xcor = aimpoints[0][1]  # x
-        aimpoint_ycor = aimpoints[0][2]  # y
-        aimpoint_type = aimpoints[0][3]  # type
+        aimpoint_time = aimpoint[0]  # time
+        aimpoint_xcor = aimpoint[1]  # x
+        aimpoint_ycor = aimpoint[2]  # y
+        aimpoint_type = aimpoint[3]  # type
 
         # If the scorepoint is not a HOLD, ignore
         if aimpoint_type != StdMapData.TYPE_HOLD:
             return StdScoreData.__ADV_NOP
 
-        time_offset = replay_time - aimpoint_time
-        posx_offset = replay_xpos - aimpoint_xcor
-        posy_offset = replay_ypos - aimpoint_ycor
-        pos_offset  = (posx_offset**2 + posy_offset**2)**0.5
-
         if settings.require_aim_hold:
-            is_miss_aim = pos_offset > settings.follow_radius
+            radius = settings.follow_radius
+            if posx_offset > radius or posx_offset < -radius or posy_offset > radius or posy_offset < -radius:
+                is_miss_aim = True
+            else:
+                is_miss_aim = (posx_offset*posx_offset + posy_offset*posy_offset) > settings.follow_radius_sq
             rec_x, rec_y = replay_xpos, replay_ypos
         else:
             is_miss_aim = False
             rec_x, rec_y = aimpoint_xcor, aimpoint_ycor
 
         if settings.require_tap_hold:
-            is_in_neg_nothing_range =                           time_offset <= -settings.neg_hld_range
-            is_in_hold_range        = -settings.neg_hld_range < time_offset <=  settings.pos_hld_range
-            is_in_pos_nothing_range =  settings.pos_hld_range < time_offset
+            neg_hld_range = settings.neg_hld_range
+            pos_hld_range = settings.pos_hld_range
+
+            is_in_neg_nothing_range =                  time_offset <= -neg_hld_range
+            is_in_hold_range        = -neg_hld_range < time_offset <=  pos_hld_range
+            is_in_pos_nothing_range =  pos_hld_range < time_offset
         else:
             is_in_neg_nothing_range = False
             is_in_hold_range        = time_offset >= 0
@@ -573,19 +766,19 @@ class StdScoreData():
             if settings.recoverable_missaim:
                 is_late = settings.pos_hld_range < time_offset
                 if is_late:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD ])
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD)
                     return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
                 else:
                     return StdScoreData.__ADV_NOP
             else:
-                score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD ])
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD)
                 return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
 
         if is_in_neg_nothing_range:
             return StdScoreData.__ADV_NOP
         
         if is_in_hold_range:
-            score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_AIMH, StdReplayData.HOLD ])
+            score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_AIMH, StdReplayData.HOLD)
             return StdScoreData.__ADV_AIMP
 
         if is_in_pos_nothing_range:
@@ -595,81 +788,74 @@ class StdScoreData():
 
 
     @staticmethod
-    def __process_release(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
+    def __process_release(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos):
         # Note start and end params
-        aimpoint_time = aimpoints[0][0]  # time
-        aimpoint_xcor = aimpoints[0][1]  # x
-        aimpoint_ycor = aimpoints[0][2]  # y
-        aimpoint_type = aimpoints[0][3]  # type
+        aimpoint_time = aimpoint[0]  # time
+        aimpoint_xcor = aimpoint[1]  # x
+        aimpoint_ycor = aimpoint[2]  # y
+        aimpoint_type = aimpoint[3]  # type
 
         # If the scorepoint expects a press, then ignore
         if aimpoint_type == StdMapData.TYPE_PRESS:
             return StdScoreData.__ADV_NOP
 
-        time_offset = replay_time - aimpoint_time
-        posx_offset = replay_xpos - aimpoint_xcor
-        posy_offset = replay_ypos - aimpoint_ycor
-        pos_offset  = (posx_offset**2 + posy_offset**2)**0.5
-
         if settings.require_aim_release:
-            is_miss_aim = pos_offset > settings.release_radius
+            radius = settings.release_radius
+            if posx_offset > radius or posx_offset < -radius or posy_offset > radius or posy_offset < -radius:
+                is_miss_aim = True
+            else:
+                is_miss_aim = (posx_offset*posx_offset + posy_offset*posy_offset) > settings.release_radius_sq
             rec_x, rec_y = replay_xpos, replay_ypos
         else:
             is_miss_aim = False
             rec_x, rec_y = aimpoint_xcor, aimpoint_ycor
 
-        if settings.require_tap_release:
-            is_in_neg_nothing_range =                                time_offset <= -settings.neg_rel_miss_range
-            is_in_neg_miss_range    = -settings.neg_rel_miss_range < time_offset <= -settings.neg_rel_range
-            is_in_rel_range         = -settings.neg_rel_range      < time_offset <=  settings.pos_rel_range
-            is_in_pos_miss_range    =  settings.pos_rel_range      < time_offset <=  settings.pos_rel_miss_range
-            is_in_pos_nothing_range =  settings.pos_rel_miss_range < time_offset
-        else:
-            is_in_neg_nothing_range = False
-            is_in_neg_miss_range    = False
-            is_in_rel_range         = time_offset >= 0
-            is_in_pos_miss_range    = False
-            is_in_pos_nothing_range = False
-
         if aimpoint_type == StdMapData.TYPE_HOLD:
             if settings.require_tap_hold:
                 if settings.recoverable_release:
                     return StdScoreData.__ADV_NOP
                 else:
-                    score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD ])
+                    score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.HOLD)
                     return StdScoreData.__ADV_NOTE if settings.miss_slider else StdScoreData.__ADV_AIMP
             
             return StdScoreData.__ADV_NOP
 
         # If release range is enabled, releases must be within the release radius to count
         if is_miss_aim:
-            score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE ])
+            score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE)
             return StdScoreData.__ADV_NOTE
 
         # Stuff after this requires tap processing
 
-        if is_in_neg_nothing_range:
+        if settings.require_tap_release:
+            window = StdScoreData.__timing_window(settings.rel_bounds, time_offset)
+        elif time_offset >= 0:
+            window = StdScoreData.__WINDOW_HIT
+        else:
+            window = StdScoreData.__WINDOW_POS_NOTHING
+
+        if window == StdScoreData.__WINDOW_NEG_NOTHING:
             return StdScoreData.__ADV_NOP
 
-        if is_in_neg_miss_range:
+        if window == StdScoreData.__WINDOW_NEG_MISS:
             if settings.release_miss:
-                score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE ])
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE)
                 return StdScoreData.__ADV_NOTE
             else:
                 return StdScoreData.__ADV_NOP
 
-        if is_in_rel_range:
-            score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITR, StdReplayData.RELEASE ])
+        if window == StdScoreData.__WINDOW_HIT:
+            score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_HITR, StdReplayData.RELEASE)
             return StdScoreData.__ADV_NOTE
 
-        if is_in_pos_miss_range:
+        if window == StdScoreData.__WINDOW_POS_MISS:
             if settings.release_miss:
-                score_data[len(score_data)] = np.asarray([ replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE ])
+                score_data.push(replay_time, aimpoint_time, rec_x, rec_y, aimpoint_xcor, aimpoint_ycor, StdScoreData.TYPE_MISS, StdReplayData.RELEASE)
                 return StdScoreData.__ADV_NOTE
             else:
                 return StdScoreData.__ADV_NOP
 
-        if is_in_pos_nothing_range:
+        if window == StdScoreData.__WINDOW_POS_NOTHING:
             # Way late release, interpret as never released.
             # Ignore these and let FREE processing handle it.
             return StdScoreData.__ADV_NOP
@@ -677,38 +863,101 @@ class StdScoreData():
         return StdScoreData.__ADV_NOP
 
 
+    # Scoring processor to use for each replay key state
+    __PROCESSORS = {
+        StdReplayData.FREE    : __process_free,
+        StdReplayData.PRESS   : __process_press,
+        StdReplayData.HOLD    : __process_hold,
+        StdReplayData.RELEASE : __process_release,
+    }
+
+
     @staticmethod
     def get_score_data(replay_data, map_data, settings=Settings()):
-        # Score data that will be filled in and returned
-        score_data = {}
+        return pd.DataFrame(StdScoreData.get_score_data_raw(replay_data, map_data, settings))
+
 
+    @staticmethod
+    def get_score_data_raw(replay_data, map_data, settings=Settings()):
+        """
+        Same as ``StdScoreData.get_score_data``, but returns the score data columns
+        without building a dataframe out of them
+
+        Returns
+        -------
+        dict
+            Column name to ``numpy.array`` of the column, in the dtypes of ``StdScoreData._OUT_DTYPES``
+        """
         # replay pointer
         replay_idx = 0
 
-        # Filter out single note release points
-        filter_single_release = np.ones(map_data.shape[0], dtype=np.bool8)
-        filter_single_release[1:] = ~( \
-            (map_data['type'].values[:-1] == StdMapData.TYPE_PRESS) &             \
-            (map_data['type'].values[1:] == StdMapData.TYPE_RELEASE) &            \
-            ((map_data['time'].values[1:] - map_data['time'].values[:-1]) == 1) & \
-            ((map_data['x'].values[1:] - map_data['x'].values[:-1]) == 0) &       \
-            ((map_data['y'].values[1:] - map_data['y'].values[:-1]) == 0)
-        )
-
-        map_data = map_data[filter_single_release]
+        # Pull the map columns out of the dataframe once
+        map_ts    = map_data['time'].to_numpy(copy=False)
+        map_xs    = map_data['x'].to_numpy(copy=False)
+        map_ys    = map_data['y'].to_numpy(copy=False)
+        map_types = map_data['type'].to_numpy(copy=False)
+        map_objs  = map_data['object'].to_numpy(copy=False)
 
-        # map_time is the time at which hitobject processing logic is at
-        map_times = map_data.values[:, StdMapData.IDX_TIME]
-        map_time = map_times[0]
-        map_time_max = map_times[-1]
+        # Filter out single note release points
+        # (release aimpoint 1 ms after, and at the same position as, a press aimpoint)
+        is_single_release = (map_types[1:] == StdMapData.TYPE_RELEASE)
+        is_single_release &= (map_types[:-1] == StdMapData.TYPE_PRESS)
+        is_single_release &= (np.diff(map_ts) == 1)
+        is_single_release &= (map_xs[1:] == map_xs[:-1])
+        is_single_release &= (map_ys[1:] == map_ys[:-1])
+
+        filter_single_release = np.ones(map_ts.shape[0], dtype=bool)
+        np.logical_not(is_single_release, out=filter_single_release[1:])
+
+        # map_idx is the aimpoint hitobject processing logic is at and map_time is its time
+        map_values = np.column_stack((
+            map_ts[filter_single_release], 
+            map_xs[filter_single_release], 
+            map_ys[filter_single_release], 
+            map_types[filter_single_release], 
+            map_objs[filter_single_release],
+        )).astype(np.float64, copy=False)
+        map_times = map_values[:, StdMapData.IDX_TIME]
+        map_idx = 0
+        map_idx_max = map_times.shape[0]
+
+        # The scoring loop is scalar code, so it reads aimpoints as python floats
+        # which are far cheaper to do arithmetic and comparisons on than numpy scalars
+        map_aimpoints = map_values.tolist()
+        map_time_max = map_aimpoints[-1][StdMapData.IDX_TIME]
+
+        # Aimpoint times with a sentinel past the end, so looking up the time at the index
+        # `__adv` returns once the map is exhausted needs no special casing
+        map_time_list = map_times.tolist()
+        map_time_list.append(map_time_max + 1)
+        map_time = map_time_list[map_idx]
+
+        # Per column lists of the aimpoint positions the loop computes offsets against.
+        # Processors still get the whole aimpoint row from `map_aimpoints`.
+        map_x_list = map_values[:, StdMapData.IDX_X].tolist()
+        map_y_list = map_values[:, StdMapData.IDX_Y].tolist()
+
+        # Running max of aimpoint times allows binary searching for the first aimpoint at or after
+        # some time even though aimpoints of overlapping hitobjects are not in time order
+        map_times_cummax = np.maximum.accumulate(map_times)
+
+        # Likewise, the running min of aimpoint times taken from the end allows binary searching for
+        # the index past which no aimpoint is at or before some time
+        map_times_cummin = np.minimum.accumulate(map_times[::-1])[::-1]
+
+        adv_tables = StdScoreData.__adv_tables(map_values)
 
         # Number of things to loop through
-        replay_data = StdReplayData.get_reduced_replay_data(replay_data, press_block=settings.press_block, release_block=settings.release_block).values
-        replay_idx_max = replay_data.shape[0]
+        replay_time_arr, replay_xpos_arr, replay_ypos_arr, replay_key_arr = \
+            StdReplayData.get_reduced_replay_data_ndarray(replay_data, press_block=settings.press_block, release_block=settings.release_block)
+        replay_idx_max = replay_time_arr.shape[0]
 
-        # Keeps track of the last position at which the player tapped a key
-        # Resets for every new note
-        last_tap_pos = [ np.nan, np.nan ]
+        replay_times = replay_time_arr.tolist()
+        replay_xposs = replay_xpos_arr.tolist()
+        replay_yposs = replay_ypos_arr.tolist()
+        replay_keys  = replay_key_arr.tolist()
+
+        processors = StdScoreData.__PROCESSORS
 
         earliest_window_range = max(
             settings.neg_hit_miss_range,
@@ -722,6 +971,29 @@ class StdScoreData():
             settings.pos_hld_range
         )
 
+        # Searching for the first aimpoint at or after max(map_time, replay_time - earliest_window_range)
+        # is the same as taking the max of the searches for each term. Both are done up front for all
+        # replay frames and all aimpoints, so the loop only has to pick the larger of two indices.
+        window_start_idxs = np.searchsorted(map_times_cummax, replay_time_arr - earliest_window_range, side='left').tolist()
+        # The exhausted map is looked up at its sentinel time too. Aimpoints of a slider overlapping
+        # the last listed note can be later than that time, and stay pending until their window closes.
+        map_start_idxs = np.searchsorted(map_times_cummax, map_time_list, side='left').tolist()
+        map_start_idx = map_start_idxs[map_idx]
+
+        # Pending aimpoints of a replay frame all lie before the index past which no aimpoint
+        # is within `replay_time + latest_window_range`. This does not depend on map state.
+        window_end_idxs = np.searchsorted(map_times_cummin, replay_time_arr + latest_window_range, side='right').tolist()
+
+        # Score data that will be filled in and returned
+        score_data = StdScoreData._ScoreBuf(replay_idx_max + map_idx_max)
+
+        # Keeps track of the last position at which the player tapped a key
+        # Resets for every new note. Processors update it in place, so the
+        # same two element buffer is reused for the whole play.
+        last_tap_pos = [ np.nan, np.nan ]
+
+        settings = StdScoreData.__freeze_settings(settings)
+
         # Go through replay events
         while True:
             # Condition check whether all player actions in the column have been processed
@@ -729,39 +1001,47 @@ class StdScoreData():
                 break
 
             # Data for this event frame
-            replay_time = replay_data[replay_idx][0]  # time
-            replay_xpos = replay_data[replay_idx][1]  # x
-            replay_ypos = replay_data[replay_idx][2]  # y
-            replay_key  = replay_data[replay_idx][3]  # keys
+            replay_time = replay_times[replay_idx]
+            replay_xpos = replay_xposs[replay_idx]
+            replay_ypos = replay_yposs[replay_idx]
+            replay_key  = replay_keys[replay_idx]
 
             # Got all info at current index, now advance it
             replay_idx += 1
 
+            # Offsets of this frame relative to the aimpoint at map index `offsets_idx`.
+            # Computed once per aimpoint and shared by all processors that look at it.
+            offsets_idx = -1
+
             # Go through map
             while True:
-                if map_time > map_time_max:
-                    # Reached end of map
+                if replay_time < map_time:
+                    # Replay time needs to catch up to the current map time. Free processing
+                    # only looks at aimpoints that have passed, so no notes were skipped.
                     break
 
-                if replay_time < map_time - earliest_window_range:
-                    # Replay time needs to catch up to the current map time
-                    # Until within hit window processing range or notes are visible
+                if map_time > map_time_max:
+                    # Reached end of map
                     break
 
-                # In theory, should never be 0
-                current_aimpoint_select = (map_time == map_times)
-                current_aimpoint = map_data.values[current_aimpoint_select]
+                if offsets_idx != map_idx:
+                    offsets_idx = map_idx
+                    time_offset = replay_time - map_time
+                    posx_offset = replay_xpos - map_x_list[map_idx]
+                    posy_offset = replay_ypos - map_y_list[map_idx]
 
                 # Check for any skipped notes (if replay has event gaps)
-                adv = StdScoreData.__process_free(settings, score_data, current_aimpoint, replay_time, replay_xpos, replay_ypos, last_tap_pos)
+                adv = StdScoreData.__process_free(settings, score_data, map_aimpoints[map_idx], replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
                 if adv == StdScoreData.__ADV_NOP:
                     break
 
                 # Advancing to next note, reset last_tap_pos
-                last_tap_pos = [ np.nan, np.nan ]
+                last_tap_pos[0] = last_tap_pos[1] = np.nan
 
                 # Process advancement
-                map_time = StdScoreData.__adv(map_data, map_time, adv)
+                map_idx = StdScoreData.__adv(adv_tables, map_idx, adv)
+                map_time = map_time_list[map_idx]
+                map_start_idx = map_start_idxs[map_idx]
 
             # replay_time is considered to be the time experienced by the player
             # At this time the player will be able to `ar_ms` ahead of current time
@@ -778,64 +1058,82 @@ class StdScoreData():
 
             #visible_notes = map_data.values[visible_notes_select]
             
-            # Select score points that occur after current map time and
-            # that are within the current replay time's hit window range
-            pending_notes_select = (map_time <= map_times) & \
-                (((replay_time - earliest_window_range) <= map_times) & (map_times <= (replay_time + latest_window_range)))
-
-            if np.count_nonzero(pending_notes_select) == 0:
+            # Select first score point that occurs after current map time and
+            # that is within the current replay time's hit window range
+            pending_time_min = max(map_time, replay_time - earliest_window_range)
+            pending_time_max = replay_time + latest_window_range
+
+            # First aimpoint at or after `pending_time_min`
+            pending_idx = max(map_start_idx, window_start_idxs[replay_idx - 1])
+            pending_end = window_end_idxs[replay_idx - 1]
+            if pending_idx >= pending_end:
                 # Nothing to process
                 continue
 
-            visible_notes = map_data.values[pending_notes_select]
+            if map_time_list[pending_idx] > pending_time_max:
+                # Aimpoints of overlapping hitobjects are not in time order, so
+                # a later listed aimpoint may still fall within the window
+                pending_times = map_times[pending_idx:pending_end]
+                pending_notes_select = (pending_time_min <= pending_times) & (pending_times <= pending_time_max)
+                pending_offset = np.argmax(pending_notes_select)
+                if not pending_notes_select[pending_offset]:
+                    # Nothing to process
+                    continue
+
+                pending_idx += pending_offset
+
+            aimpoint = map_aimpoints[pending_idx]
+
+            if offsets_idx != pending_idx:
+                offsets_idx = pending_idx
+                time_offset = replay_time - map_time_list[pending_idx]
+                posx_offset = replay_xpos - map_x_list[pending_idx]
+                posy_offset = replay_ypos - map_y_list[pending_idx]
 
             # Interpolate replay data
-            #aimpoint_time = visible_notes[0, StdMapData.IDX_TIME]
+            #aimpoint_time = aimpoint[StdMapData.IDX_TIME]
             #replay_time, replay_xpos, replay_ypos = \
             #    StdScoreData.__interpolate_replay_data(aimpoint_time, replay_data, replay_idx - 1)
 
             # Process player actions
-            if replay_key == StdReplayData.FREE:    adv = StdScoreData.__process_free(settings, score_data, visible_notes, replay_time, replay_xpos, replay_ypos, last_tap_pos)
-            if replay_key == StdReplayData.PRESS:   adv = StdScoreData.__process_press(settings, score_data, visible_notes, replay_time, replay_xpos, replay_ypos, last_tap_pos)
-            if replay_key == StdReplayData.HOLD:    adv = StdScoreData.__process_hold(settings, score_data, visible_notes, replay_time, replay_xpos, replay_ypos, last_tap_pos)
-            if replay_key == StdReplayData.RELEASE: adv = StdScoreData.__process_release(settings, score_data, visible_notes, replay_time, replay_xpos, replay_ypos, last_tap_pos)
+            adv = processors[replay_key](settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
 
             # If advancing to next note, reset last_tap_pos
             if adv != StdScoreData.__ADV_NOP:
-                last_tap_pos = [ np.nan, np.nan ]
+                last_tap_pos[0] = last_tap_pos[1] = np.nan
 
             # Process advancement
-            map_time = StdScoreData.__adv(map_data, map_time, adv)
+            map_idx = StdScoreData.__adv(adv_tables, map_idx, adv)
+            map_time = map_time_list[map_idx]
+            map_start_idx = map_start_idxs[map_idx]
 
-        # Convert recorded timings and states into a pandas data
-        score_data = list(score_data.values())
-        return pd.DataFrame(score_data, columns=['replay_t', 'map_t', 'replay_x', 'replay_y', 'map_x', 'map_y', 'type', 'action' ])
+        return {
+            col : getattr(score_data, col)[:score_data.n] for col in StdScoreData._OUT_DTYPES
+        }
 
 
     @staticmethod
     def __interpolate_replay_data(aimpoint_time, replay_data, replay_idx):
-        replay_time_curr = replay_data[replay_idx][0]
-        replay_xpos_curr = replay_data[replay_idx][1]
-        replay_ypos_curr = replay_data[replay_idx][2]
+        replay_time_curr = replay_data[replay_idx, 0]
+        replay_xpos_curr = replay_data[replay_idx, 1]
+        replay_ypos_curr = replay_data[replay_idx, 2]
 
         if replay_idx >= replay_data.shape[0] - 1:
             return replay_time_curr, replay_xpos_curr, replay_ypos_curr
         
-        replay_time_next = replay_data[replay_idx + 1][0]
-        replay_xpos_next = replay_data[replay_idx + 1][1]
-        replay_ypos_next = replay_data[replay_idx + 1][2]
+        replay_time_next = replay_data[replay_idx + 1, 0]
+        replay_xpos_next = replay_data[replay_idx + 1, 1]
+        replay_ypos_next = replay_data[replay_idx + 1, 2]
 
-        print((replay_time_curr < aimpoint_time < replay_time_next), (replay_time_curr < aimpoint_time), (aimpoint_time < replay_time_next), replay_time_curr, aimpoint_time, replay_time_next)
         if not (replay_time_curr < aimpoint_time < replay_time_next):
             return replay_time_curr, replay_xpos_curr, replay_ypos_curr
 
-        precent = (replay_time_curr - aimpoint_time) / (replay_time_next - replay_time_curr)
+        percent = (aimpoint_time - replay_time_curr) / (replay_time_next - replay_time_curr)
         
         replay_time = aimpoint_time
-        replay_xpos = precent*(replay_xpos_next - replay_xpos_curr)
-        replay_ypos = precent*(replay_ypos_next - replay_ypos_curr)
+        replay_xpos = replay_xpos_curr + percent*(replay_xpos_next - replay_xpos_curr)
+        replay_ypos = replay_ypos_curr + percent*(replay_ypos_next - replay_ypos_curr)
 
-        print(replay_time)
         return replay_time, replay_xpos, replay_ypos
             
 
@@ -895,34 +1193,67 @@ class StdScoreData():
 
     @staticmethod
     def tap_press_offsets(score_data):
-        hit_presses = score_data[score_data['type'] == StdScoreData.TYPE_HITP]
-        return hit_presses['replay_t'] - hit_presses['map_t']
+        hit_presses, offsets = StdScoreData.__tap_offsets(score_data, StdScoreData.TYPE_HITP)
+        return pd.Series(offsets, index=score_data.index[hit_presses])
 
 
     @staticmethod
     def tap_release_offsets(score_data):
-        hit_releases = score_data[score_data['type'] == StdScoreData.TYPE_HITR]
-        return hit_releases['replay_t'] - hit_releases['map_t']
+        hit_releases, offsets = StdScoreData.__tap_offsets(score_data, StdScoreData.TYPE_HITR)
+        return pd.Series(offsets, index=score_data.index[hit_releases])
+
+
+    @staticmethod
+    def __tap_offsets(score_data, score_type):
+        """
+        Timing offsets from the hitobject for all score points of the given type
+
+        ``score_data`` can be a dataframe from ``get_score_data`` or the columns from ``get_score_data_raw``.
+
+        Returns
+        -------
+        (numpy.array, numpy.array)
+            Mask of the score type over the rows of ``score_data``, timing offsets
+        """
+        select = (np.asarray(score_data['type']) == score_type)
+        offsets = np.subtract(np.asarray(score_data['replay_t'])[select], np.asarray(score_data['map_t'])[select], dtype=np.float64)
+        return select, offsets
+
+
+    @staticmethod
+    def __hit_press_xy(score_data):
+        """
+        Cursor offsets from the hitobject for all hit presses, filtered in one pass
+
+        ``score_data`` can be a dataframe from ``get_score_data`` or the columns from ``get_score_data_raw``.
+
+        Returns
+        -------
+        (numpy.array, numpy.array, numpy.array)
+            Hit press mask over the rows of ``score_data``, x offsets, y offsets
+        """
+        hit_presses = (np.asarray(score_data['type']) == StdScoreData.TYPE_HITP)
+        offset_x = np.subtract(np.asarray(score_data['replay_x'])[hit_presses], np.asarray(score_data['map_x'])[hit_presses], dtype=np.float64)
+        offset_y = np.subtract(np.asarray(score_data['replay_y'])[hit_presses], np.asarray(score_data['map_y'])[hit_presses], dtype=np.float64)
+        return hit_presses, offset_x, offset_y
 
 
     @staticmethod
     def aim_x_offsets(score_data):
-        hit_presses = score_data[score_data['type'] == StdScoreData.TYPE_HITP]
-        return hit_presses['replay_x'] - hit_presses['map_x']
+        hit_presses, offset_x, _ = StdScoreData.__hit_press_xy(score_data)
+        return pd.Series(offset_x, index=score_data.index[hit_presses])
 
 
     @staticmethod
     def aim_y_offsets(score_data):
-        hit_presses = score_data[score_data['type'] == StdScoreData.TYPE_HITP]
-        return hit_presses['replay_y'] - hit_presses['map_y']
+        hit_presses, _, offset_y = StdScoreData.__hit_press_xy(score_data)
+        return pd.Series(offset_y, index=score_data.index[hit_presses])
 
 
     @staticmethod
     def aim_offsets(score_data):
-        hit_presses = score_data[score_data['type'] != StdScoreData.TYPE_HITR]
-        offset_x = hit_presses['replay_x'] - hit_presses['map_x']
-        offset_y = hit_presses['replay_y'] - hit_presses['map_y']
-        return (offset_x**2 + offset_y**2)**0.5
+        hit_presses, offset_x, offset_y = StdScoreData.__hit_press_xy(score_data)
+        return pd.Series(np.hypot(offset_x, offset_y), index=score_data.index[hit_presses])
 
 
     @staticmethod
@@ -947,7 +1278,7 @@ class StdScoreData():
         -------
         float
         """
-        return np.mean(StdScoreData.tap_press_offsets(score_data))
+        return np.mean(StdScoreData.__tap_offsets(score_data, StdScoreData.TYPE_HITP)[1])
 
 
     @staticmethod
@@ -964,7 +1295,7 @@ class StdScoreData():
         -------
         float
         """
-        return np.var(StdScoreData.tap_press_offsets(score_data))
+        return np.var(StdScoreData.__tap_offsets(score_data, StdScoreData.TYPE_HITP)[1])
 
 
     @staticmethod
@@ -981,7 +1312,27 @@ class StdScoreData():
         -------
         float
         """
-        return np.std(StdScoreData.tap_press_offsets(score_data))
+        return np.std(StdScoreData.__tap_offsets(score_data, StdScoreData.TYPE_HITP)[1])
+
+
+    @staticmethod
+    def tap_offset_stats(score_data):
+        """
+        Average, variance, and standard deviation of tap offsets, computed from
+        one pass of filtering out the tap offsets
+
+        Parameters
+        ----------
+        score_data : numpy.array
+            Score data
+
+        Returns
+        -------
+        (float, float, float)
+            ``( mean, var, stdev )``, same as ``tap_offset_mean``, ``tap_offset_var``, and ``tap_offset_stdev``
+        """
+        mean, var = StdScoreData.__mean_var(StdScoreData.__tap_offsets(score_data, StdScoreData.TYPE_HITP)[1])
+        return mean, var, math.sqrt(var)
 
 
     @staticmethod
@@ -998,7 +1349,8 @@ class StdScoreData():
         -------
         float
         """
-        return np.mean(StdScoreData.aim_offsets(score_data))
+        _, offset_x, offset_y = StdScoreData.__hit_press_xy(score_data)
+        return np.mean(np.hypot(offset_x, offset_y))
 
 
     @staticmethod
@@ -1015,7 +1367,8 @@ class StdScoreData():
         -------
         float
         """
-        return np.var(StdScoreData.aim_offsets(score_data))
+        _, offset_x, offset_y = StdScoreData.__hit_press_xy(score_data)
+        return np.var(np.hypot(offset_x, offset_y))
 
 
     @staticmethod
@@ -1032,7 +1385,131 @@ class StdScoreData():
         -------
         float
         """
-        return np.std(StdScoreData.aim_offsets(score_data))
+        _, offset_x, offset_y = StdScoreData.__hit_press_xy(score_data)
+        return np.std(np.hypot(offset_x, offset_y))
+
+
+    @staticmethod
+    def cursor_pos_offset_stats(score_data):
+        """
+        Average, variance, and standard deviation of cursor position offsets at moments the
+        player tapped notes, computed from one pass of filtering out the cursor offsets
+
+        Parameters
+        ----------
+        score_data : numpy.array
+            Score data
+
+        Returns
+        -------
+        (float, float, float)
+            ``( mean, var, stdev )``, same as ``cursor_pos_offset_mean``, ``cursor_pos_offset_var``, and ``cursor_pos_offset_stdev``
+        """
+        _, offset_x, offset_y = StdScoreData.__hit_press_xy(score_data)
+        mean, var = StdScoreData.__mean_var(np.hypot(offset_x, offset_y))
+        return mean, var, math.sqrt(var)
+
+
+    # Hit press offsets the odds_* functions build their distribution models from; see `__odds_ctx`
+    __OddsCtx = namedtuple('OddsCtx', [ 'tap_offsets', 'aim_x_offsets', 'aim_y_offsets' ])
+
+
+    @staticmethod
+    def __odds_ctx(score_data):
+        """
+        Filters out the hit presses of the score data once and extracts the offsets
+        the odds_* functions need, so multiple of them can share one pass over the data.
+        """
+        _, tap_offsets = StdScoreData.__tap_offsets(score_data, StdScoreData.TYPE_HITP)
+        _, aim_x_offsets, aim_y_offsets = StdScoreData.__hit_press_xy(score_data)
+
+        return StdScoreData.__OddsCtx(tap_offsets, aim_x_offsets, aim_y_offsets)
+
+
+    @staticmethod
+    def __odds_all(odds_some, num_hits):
+        """
+        Odds of ``num_hits`` independent hits all succeeding, given the odds ``odds_some`` of one succeeding
+        """
+        # Certain outcomes stay certain no matter how many hits there are
+        if odds_some == 0 or odds_some == 1:
+            return float(odds_some)
+
+        return float(odds_some)**num_hits
+
+
+    @staticmethod
+    def __cursor_stats(aim_x_offsets, aim_y_offsets):
+        """
+        Mean and covariance of the 2D cursor position offsets of hit presses
+
+        Returns
+        -------
+        (numpy.array, numpy.array)
+            ``[ mean_x, mean_y ]`` and the 2x2 covariance matrix
+        """
+        mean = np.asarray([ np.mean(aim_x_offsets), np.mean(aim_y_offsets) ])
+        covariance = StdScoreData.__cov2(aim_x_offsets, aim_y_offsets, mean[0], mean[1])
+
+        return mean, covariance
+
+
+    @staticmethod
+    def __mean_var(x):
+        """
+        Mean and population variance of ``x``. Same as ``np.mean(x)``
+        and ``np.var(x)``, but sharing the sum between the two.
+
+        Returns
+        -------
+        (float, float)
+            ``( mean, var )``, both nan if ``x`` is empty
+        """
+        n = x.shape[0]
+        if n == 0:
+            return np.nan, np.nan
+
+        mean = x.sum()/n
+        dx = x - mean
+
+        return mean, (dx @ dx)/n
+
+
+    @staticmethod
+    def __mean_std(x):
+        """
+        Mean and population standard deviation of ``x``; see ``__mean_var``
+        """
+        mean, var = StdScoreData.__mean_var(x)
+        return mean, math.sqrt(var)
+
+
+    @staticmethod
+    def __cov2(x, y, mean_x, mean_y):
+        """
+        Sample covariance matrix of two variables. Same as ``np.cov([ x, y ])``, 
+        but without stacking the variables into a new 2xN array.
+
+        Returns
+        -------
+        numpy.array
+            ``[[ var_x, cov_xy ], [ cov_xy, var_y ]]``
+        """
+        dof = x.shape[0] - 1
+        if dof <= 0:
+            return np.full((2, 2), np.nan)
+
+        dx = x - mean_x
+        dy = y - mean_y
+
+        cov_xx = (dx @ dx)/dof
+        cov_yy = (dy @ dy)/dof
+        cov_xy = (dx @ dy)/dof
+
+        return np.asarray([
+            [ cov_xx, cov_xy ],
+            [ cov_xy, cov_yy ],
+        ])
 
 
     @staticmethod
@@ -1056,17 +1533,26 @@ class StdScoreData():
             In simpler terms, look at all the hits for scores; What are the odds 
             of you picking a random hit that is between ``-offset`` and ``offset``?
         """
-        mean  = StdScoreData.tap_offset_mean(score_data)
-        stdev = StdScoreData.tap_offset_stdev(score_data)
+        return StdScoreData.__odds_some_tap_within(StdScoreData.__odds_ctx(score_data), offset)
+
+
+    @staticmethod
+    def __odds_some_tap_within(ctx, offset):
+        mean, stdev = StdScoreData.__mean_std(ctx.tap_offsets)
 
-        # scipy cdf can't handle 0 stdev (div by 0)
+        # Normal cdf can't handle 0 stdev (div by 0)
         if stdev == 0:
             return 1.0 if -offset <= mean <= offset else 0.0
 
-        prob_greater_than_neg = scipy.stats.norm.cdf(-offset, loc=mean, scale=stdev)
-        prob_less_than_pos = scipy.stats.norm.cdf(offset, loc=mean, scale=stdev)
+        z_pos = (offset - mean)/stdev
+        z_neg = (-offset - mean)/stdev
+
+        # ndtr is the standard normal cdf. When the whole range is above the mean, take the
+        # difference of the upper tails instead, which keeps precision for small probabilities.
+        if z_neg > 0:
+            return float(scipy.special.ndtr(-z_neg) - scipy.special.ndtr(-z_pos))
 
-        return prob_less_than_pos - prob_greater_than_neg
+        return float(scipy.special.ndtr(z_pos) - scipy.special.ndtr(z_neg))
 
 
     @staticmethod
@@ -1090,21 +1576,17 @@ class StdScoreData():
             In simpler terms, look at all the cursor positions for score; What are the odds of you picking a random hit that has 
             a cursor position between an area of ``(-offset, -offset)`` and ``(offset, offset)``?
         """ 
-        aim_x_offsets = StdScoreData.aim_x_offsets(score_data)
-        aim_y_offsets = StdScoreData.aim_y_offsets(score_data)
+        return StdScoreData.__odds_some_cursor_within(StdScoreData.__odds_ctx(score_data), offset)
 
-        mean_aim_x = np.mean(aim_x_offsets)
-        mean_aim_y = np.mean(aim_y_offsets)
 
-        mean = np.asarray([ mean_aim_x, mean_aim_y ])
-        covariance = np.cov(np.asarray([ aim_x_offsets, aim_y_offsets ]))
-        
+    @staticmethod
+    def __odds_some_cursor_within(ctx, offset):
+        mean, covariance = StdScoreData.__cursor_stats(ctx.aim_x_offsets, ctx.aim_y_offsets)
         distribution = scipy.stats.multivariate_normal(mean, covariance, allow_singular=True)
 
-        prob_less_than_neg = distribution.cdf(np.asarray([-offset, -offset]))
-        prob_less_than_pos = distribution.cdf(np.asarray([offset, offset]))
-
-        return prob_less_than_pos - prob_less_than_neg
+        # Probability of the square (-offset, -offset) -> (offset, offset). F(o, o) - F(-o, -o) would
+        # also count the strips where only one of the coordinates is below -offset.
+        return distribution.cdf(np.asarray([offset, offset]), lower_limit=np.asarray([-offset, -offset]))
 
 
     @staticmethod
@@ -1129,8 +1611,12 @@ class StdScoreData():
         """
         # TODO: handle misses
 
-        hit_presses = score_data[score_data['type'] == StdScoreData.TYPE_HITP]
-        return StdScoreData.odds_some_tap_within(score_data, offset)**len(hit_presses)
+        ctx = StdScoreData.__odds_ctx(score_data)
+        num_hits = len(ctx.tap_offsets)
+        if num_hits == 0:
+            return 1.0
+
+        return StdScoreData.__odds_all(StdScoreData.__odds_some_tap_within(ctx, offset), num_hits)
 
 
     @staticmethod
@@ -1156,8 +1642,12 @@ class StdScoreData():
         """
         # TODO: handle misses
 
-        hit_presses = score_data[score_data['type'] == StdScoreData.TYPE_HITP]
-        return StdScoreData.odds_some_cursor_within(score_data, offset)**len(hit_presses)
+        ctx = StdScoreData.__odds_ctx(score_data)
+        num_hits = len(ctx.tap_offsets)
+        if num_hits == 0:
+            return 1.0
+
+        return StdScoreData.__odds_all(StdScoreData.__odds_some_cursor_within(ctx, offset), num_hits)
 
 
     @staticmethod
@@ -1181,7 +1671,15 @@ class StdScoreData():
         -------
         float
         """
-        odds_all_tap_within    = StdScoreData.odds_all_tap_within(score_data, tap_offset)
-        odds_all_cursor_within = StdScoreData.odds_all_cursor_within(score_data, cursor_offset)
+        ctx = StdScoreData.__odds_ctx(score_data)
+        num_hits = len(ctx.tap_offsets)
+        if num_hits == 0:
+            return 1.0
+
+        odds_all_tap_within = StdScoreData.__odds_all(StdScoreData.__odds_some_tap_within(ctx, tap_offset), num_hits)
+        if odds_all_tap_within == 0:
+            return 0.0
+
+        odds_all_cursor_within = StdScoreData.__odds_all(StdScoreData.__odds_some_cursor_within(ctx, cursor_offset), num_hits)
 
         return odds_all_tap_within*odds_all_cursor_within
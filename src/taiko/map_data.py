@@ -63,11 +63,15 @@ class MapData():
 
     def set_data_hitobjects(self, hitobjects):
         self.hitobject_data = [ hitobject.raw_data() for hitobject in hitobjects ]
+        self._flat_times = None
+        self._offsets    = None
         return self
 
 
     def set_data_raw(self, raw_data):
         self.hitobject_data = raw_data
+        self._flat_times = None
+        self._offsets    = None
         return self
 
 
@@ -78,6 +82,9 @@ class MapData():
         if is_part_of_hitobject: self.hitobject_data[-1].append(raw_data)
         else:                    self.hitobject_data.append([ raw_data ])
 
+        self._flat_times = None
+        self._offsets    = None
+
 
     def append_to_start(self, raw_data, is_part_of_hitobject=False):
         if raw_data == None:   return
@@ -86,13 +93,43 @@ class MapData():
         if is_part_of_hitobject: self.hitobject_data[0].insert(0, raw_data)
         else:                    self.hitobject_data.insert(0, [ raw_data ])
 
+        self._flat_times = None
+        self._offsets    = None
+
+
+    def __build_times(self):
+        """
+        Flattens the timings of all score points into one array, along with the
+        offsets of where each hitobject's score points start in it (CSR-style).
+        Cached until the hitobject data is modified via set_data_* / append_to_*
+        """
+        if self._flat_times is not None:
+            return
+
+        num_points = np.fromiter((len(note) for note in self.hitobject_data), dtype=np.int64, count=len(self.hitobject_data))
+
+        self._offsets     = np.zeros(len(num_points) + 1, dtype=np.int64)
+        self._offsets[1:] = np.cumsum(num_points)
+        self._flat_times  = np.array([ data[MapData.TIME] for note in self.hitobject_data for data in note ])  # Keeps the dtype of the source timings
+
+        # Kept around so index lookups can binary search them directly
+        self._start_times = self._flat_times[self._offsets[:-1]]
+        self._end_times   = self._flat_times[self._offsets[1:] - 1]
+
+        # Accessors hand out copies; the cache itself must never be modified in place
+        self._flat_times.flags.writeable  = False
+        self._start_times.flags.writeable = False
+        self._end_times.flags.writeable   = False
+
 
     def start_times(self):
-        return np.array([ note[0][MapData.TIME] for note in self.hitobject_data ])
+        self.__build_times()
+        return self._start_times.copy()
 
 
     def end_times(self):
-        return np.array([ note[-1][MapData.TIME] for note in self.hitobject_data ])
+        self.__build_times()
+        return self._end_times.copy()
 
 
     def start_positions(self):
@@ -109,8 +146,11 @@ class MapData():
 
 
     def all_times(self, flat=True):
-        if flat: return np.array([ data[MapData.TIME] for note in self.hitobject_data for data in note ])
-        else:    return [[data[MapData.TIME] for data in note] for note in self.hitobject_data]
+        if not flat:
+            return [[data[MapData.TIME] for data in note] for note in self.hitobject_data]
+
+        self.__build_times()
+        return self._flat_times.copy()
 
 
     def start_end_times(self):
@@ -119,17 +159,19 @@ class MapData():
 
 
     def get_idx_start_time(self, time):
-        if not time: return None
+        if time is None: return None
 
-        times = np.array(self.start_times())
-        return min(max(0, np.searchsorted(times, [time], side='right')[0] - 1), len(times))
+        self.__build_times()
+        times = self._start_times
+        return min(max(0, int(np.searchsorted(times, time, side='right')) - 1), len(times))
 
 
     def get_idx_end_time(self, time):
-        if not time: return None
-            
-        times = np.array(self.end_times())
-        return min(max(0, np.searchsorted(times, [time], side='right')[0] - 1), len(times))
+        if time is None: return None
+
+        self.__build_times()
+        times = self._end_times
+        return min(max(0, int(np.searchsorted(times, time, side='right')) - 1), len(times))
 
 
 MapData.full_hitobject_data = MapData()
\ No newline at end of file
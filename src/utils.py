@@ -6,7 +6,5 @@ def prob_or(x, y):  return (x + y) - x*y
 
 
 def prob_trials(initial_prob, trials):
-    current_prob = initial_prob
-    for _ in range(trials):
-        current_prob = prob_or(current_prob, initial_prob)
-    return current_prob
\ No newline at end of file
+    # prob_or applied `trials` times to the same probability: 1 - (1 - p)^(trials + 1)
+    return prob_not(prob_not(initial_prob)**(max(trials, 0) + 1))
@@ -6,38 +6,51 @@ from osu_analysis import ManiaActionData
 from osu_analysis import ManiaMapMetrics
 
 
+def action_data_fixture(rows):
+    # Same layout and dtype for every hand written action data, regardless of platform int size
+    return np.array(rows, dtype=np.int64, order='C')
+
+
+# Pairs of long notes on neighboring columns shared by the overlap detector tests
+_AD_DISJOINT     = action_data_fixture([ [ 100, 200, 0 ], [ 300, 400, 1 ] ])
+_AD_TOUCHING     = action_data_fixture([ [ 100, 200, 0 ], [ 200, 300, 1 ] ])
+_AD_SAME         = action_data_fixture([ [ 100, 200, 0 ], [ 100, 200, 1 ] ])
+_AD_SAME_RELEASE = action_data_fixture([ [  50, 200, 0 ], [ 100, 200, 1 ] ])
+_AD_SAME_PRESS   = action_data_fixture([ [ 100, 150, 0 ], [ 100, 200, 1 ] ])
+_AD_OVERLAP      = action_data_fixture([ [ 100, 150, 0 ], [ 120, 200, 1 ] ])
+_AD_INSIDE       = action_data_fixture([ [ 100, 300, 0 ], [ 150, 250, 1 ] ])
+
 
 class TestManiaMetricData(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        pass
+        # Maps used by multiple tests; Action data is only read by the metrics, so it's safe to share
+        cls.chords_action_data   = ManiaActionData.get_action_data(BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu'))
+        cls.dear_you_action_data = ManiaActionData.get_action_data(BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu'))
 
 
     @classmethod
-    def tearDown(cls):
+    def tearDownClass(cls):
         pass
 
 
     def test_calc_press_rate(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
 
         # TODO: test functionality
         press_rate = ManiaMapMetrics.calc_press_rate(action_data, col=0)
 
 
     def test_calc_note_intervals(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
 
         # TODO: test functionality
         note_intervals = ManiaMapMetrics.calc_note_intervals(action_data, 0)
 
 
     def test_max_press_rate_per_col(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
 
         # TODO: test functionality
         press_rate = ManiaMapMetrics.calc_max_press_rate_per_col(action_data)
@@ -45,288 +58,229 @@ class TestManiaMetricData(unittest.TestCase):
 
     def test_detect_presses_during_holds(self):
         # Two long notes that are pressed and released at mutually exclusive times
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 300, 400, 1 ],
-        ])
+        action_data = _AD_DISJOINT
 
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes that are pressed and released at mutually exclusive times,
         # but press of one happens when the other is released
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 200, 300, 1 ],
-        ])
+        action_data = _AD_TOUCHING
 
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes that are pressed and release at same time
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 100, 200, 1 ],
-        ])
+        action_data = _AD_SAME
 
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes, where one is pressed before the other, but released at same time
-        action_data = np.asarray([
-            [ 50,  200, 0 ],
-            [ 100, 200, 1 ],
-        ])
+        action_data = _AD_SAME_RELEASE
 
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
-        self.assertFalse(np.all(mask == 0))
+        self.assertTrue(mask.any())
 
         # Two long notes that are pressed at same time, but one is released before another
-        action_data = np.asarray([
-            [ 100, 150, 0 ],
-            [ 100, 200, 1 ],
-        ])
+        action_data = _AD_SAME_PRESS
 
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes where one is pressed and released before another
-        action_data = np.asarray([
-            [ 100, 150, 0 ],
-            [ 120, 200, 1 ],
-        ])
+        action_data = _AD_OVERLAP
 
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
-        self.assertFalse(np.all(mask == 0))
+        self.assertTrue(mask.any())
 
         # Two long notes where one is pressed and released while holding another
-        action_data = np.asarray([
-            [ 100, 300, 0 ],
-            [ 150, 250, 1 ],
-        ])
+        action_data = _AD_INSIDE
 
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
-        self.assertFalse(np.all(mask == 0))
+        self.assertTrue(mask.any())
 
         # Crash test
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
 
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.dear_you_action_data
         mask = ManiaMapMetrics.detect_presses_during_holds(action_data)
 
 
     def test_detect_holds_during_release(self):
         # Two long notes that are pressed and released at mutually exclusive times
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 300, 400, 1 ],
-        ])
+        action_data = _AD_DISJOINT
 
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes that are pressed and released at mutually exclusive times,
         # but press of one happens when the other is released
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 200, 300, 1 ],
-        ])
+        action_data = _AD_TOUCHING
 
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes that are pressed and release at same time
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 100, 200, 1 ],
-        ])
+        action_data = _AD_SAME
 
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes, where one is pressed before the other, but released at same time
-        action_data = np.asarray([
-            [ 50, 200, 0 ],
-            [ 100, 200, 1 ],
-        ])
+        action_data = _AD_SAME_RELEASE
 
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes that are pressed at same time, but one is released before another
-        action_data = np.asarray([
-            [ 100, 150, 0 ],
-            [ 100, 200, 1 ],
-        ])
+        action_data = _AD_SAME_PRESS
 
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
-        self.assertFalse(np.all(mask == 0))
+        self.assertTrue(mask.any())
 
         # Two long notes where one is pressed and released before another
-        action_data = np.asarray([
-            [ 100, 150, 0 ],
-            [ 120, 200, 1 ],
-        ])
+        action_data = _AD_OVERLAP
 
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
-        self.assertFalse(np.all(mask == 0))
+        self.assertTrue(mask.any())
 
         # Two long notes where one is pressed and released while holding another
-        action_data = np.asarray([
-            [ 100, 300, 0 ],
-            [ 150, 250, 1 ],
-        ])
+        action_data = _AD_INSIDE
 
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
-        self.assertFalse(np.all(mask == 0))
+        self.assertTrue(mask.any())
 
         # Crash test
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
 
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.dear_you_action_data
         mask = ManiaMapMetrics.detect_holds_during_release(action_data)
 
 
     def test_detect_simultaneous_notes(self):
         # Two long notes that are pressed and released at mutually exclusive times
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 300, 400, 1 ],
-        ])
+        action_data = _AD_DISJOINT
 
         mask = ManiaMapMetrics.detect_simultaneous_notes(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes that are pressed and released at mutually exclusive times,
         # but press of one happens when the other is released
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 200, 300, 1 ],
-        ])
+        action_data = _AD_TOUCHING
 
         mask = ManiaMapMetrics.detect_simultaneous_notes(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
         # Two long notes that are pressed and release at same time
-        action_data = np.asarray([
-            [ 100, 200, 0 ],
-            [ 100, 200, 1 ],
-        ])
+        action_data = _AD_SAME
 
         mask = ManiaMapMetrics.detect_simultaneous_notes(action_data)
-        self.assertTrue(np.all(mask == 1))
+        self.assertTrue(mask.all())
 
 
     def test_detect_hold_notes(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
 
         mask = ManiaMapMetrics.detect_hold_notes(action_data)
-        self.assertTrue(np.all(mask == 0))
+        self.assertFalse(mask.any())
 
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.dear_you_action_data
 
         # TODO: test functionality more thourouly
         mask = ManiaMapMetrics.detect_hold_notes(action_data)
-        self.assertTrue(np.any(mask == 1))  # There are definitely hold notes in that map
+        self.assertTrue(mask.any())  # There are definitely hold notes in that map
 
 
     def test_data_to_anti_press_durations(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
 
         # TODO: test functionality
         anti_press_durations = ManiaMapMetrics.anti_press_durations(action_data)
 
 
     def test_detect_inverse(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
 
         inverse_mask = ManiaMapMetrics.detect_inverse(action_data)
-        self.assertTrue(np.all(inverse_mask == 0))
+        self.assertFalse(inverse_mask.any())
 
         beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/inverse_test.osu')
         action_data = ManiaActionData.get_action_data(beatmap)
 
         inverse_mask = ManiaMapMetrics.detect_inverse(action_data)
-        self.assertFalse(np.all(inverse_mask == 0))
+        self.assertTrue(inverse_mask.any())
 
         beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/sr_testing/high_sr_low_diff_norm_hp/3L - Endless Night x1.25 (Skorer) [Endless Longs Notes !!].osu')
         action_data = ManiaActionData.get_action_data(beatmap)
 
         inverse_mask = ManiaMapMetrics.detect_inverse(action_data)
-        self.assertFalse(np.all(inverse_mask == 0))
+        self.assertTrue(inverse_mask.any())
 
 
     def test_detect_chords(self):
         # Two single notes, one occuring after another
-        action_data = np.asarray([
+        action_data = action_data_fixture([
             [ 100, 101, 0 ],
             [ 200, 201, 1 ],
         ])
 
         mask = ManiaMapMetrics.detect_chords(action_data)
-        self.assertTrue(np.all((mask == [0, 0]) == 1))
+        self.assertTrue(np.array_equal(mask, [0, 0]))
 
         # Two single notes, both occuring at same time
-        action_data = np.asarray([
+        action_data = action_data_fixture([
             [ 100, 101, 0 ],
             [ 100, 101, 1 ],
         ])
 
         mask = ManiaMapMetrics.detect_chords(action_data)
-        self.assertTrue(np.all((mask == [1, 1]) == 1))
+        self.assertTrue(np.array_equal(mask, [1, 1]))
 
         # Two single notes occuring at same time + a jack after
-        action_data = np.asarray([
+        action_data = action_data_fixture([
             [ 100, 101, 0 ],
             [ 100, 101, 1 ],
             [ 200, 201, 1 ],
         ])
 
         mask = ManiaMapMetrics.detect_chords(action_data)
-        self.assertTrue(np.all((mask == [1, 1, 0]) == 1))
+        self.assertTrue(np.array_equal(mask, [1, 1, 0]))
 
         # Two single notes occuring at same time + a jack before
-        action_data = np.asarray([
+        action_data = action_data_fixture([
             [ 200, 201, 0 ],
             [ 200, 201, 1 ],
             [ 100, 101, 1 ],
         ])
 
         mask = ManiaMapMetrics.detect_chords(action_data)
-        self.assertTrue(np.all((mask == [1, 1, 0]) == 1))
+        self.assertTrue(np.array_equal(mask, [1, 1, 0]))
 
         # Stair case
-        action_data = np.asarray([
+        action_data = action_data_fixture([
             [ 100, 101, 0 ],
             [ 200, 201, 1 ],
             [ 300, 301, 2 ],
         ])
 
         mask = ManiaMapMetrics.detect_chords(action_data)
-        self.assertTrue(np.all((mask == [0, 0, 0]) == 1))
+        self.assertTrue(np.array_equal(mask, [0, 0, 0]))
 
         # 3 note chord
-        action_data = np.asarray([
+        action_data = action_data_fixture([
             [ 100, 101, 0 ],
             [ 100, 101, 1 ],
             [ 100, 101, 3 ],
         ])
 
         mask = ManiaMapMetrics.detect_chords(action_data)
-        self.assertTrue(np.all((mask == [1, 1, 1]) == 1))
+        self.assertTrue(np.array_equal(mask, [1, 1, 1]))
 
         # Alternation
-        action_data = np.asarray([
+        action_data = action_data_fixture([
             [ 100, 101, 0 ],
             [ 100, 101, 2 ],
             [ 200, 201, 1 ],
@@ -336,10 +290,9 @@ class TestManiaMetricData(unittest.TestCase):
         ])
 
         mask = ManiaMapMetrics.detect_chords(action_data)
-        self.assertTrue(np.all((mask == [0, 0, 0, 0, 0, 0]) == 1))
+        self.assertTrue(np.array_equal(mask, [0, 0, 0, 0, 0, 0]))
 
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/test/chords_250ms.osu')
-        action_data = ManiaActionData.get_action_data(beatmap)
+        action_data = self.chords_action_data
 
         # TODO: test functionality
         chord_mask = ManiaMapMetrics.detect_chords(action_data)
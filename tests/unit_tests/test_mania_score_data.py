@@ -1,5 +1,7 @@
 import unittest
+import functools
 import numpy as np
+import scipy.stats
 
 from beatmap_reader import BeatmapIO
 from replay_reader  import ReplayIO
@@ -11,6 +13,18 @@ from osu_analysis import ManiaScoreData
 
 class TestManiaScoreData(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Dear You map and osu!topus replay used by multiple tests; Action data is only read by the score processor, so it's safe to share
+        cls.dear_you_map_data    = ManiaActionData.get_action_data(BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu'))
+        cls.dear_you_replay_data = ManiaActionData.get_action_data(ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr'))
+
+
+    @classmethod
+    def tearDownClass(cls):
+        pass
+
+
     @classmethod
     def setUp(cls):
         ManiaScoreData.pos_hit_range       = 100
@@ -37,22 +51,22 @@ class TestManiaScoreData(unittest.TestCase):
 
 
     def test_perfect_score(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        replay = ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr')
-
-        map_data = ManiaActionData.get_action_data(beatmap)
-        replay_data = ManiaActionData.get_action_data(replay)
+        map_data = self.dear_you_map_data
+        replay_data = self.dear_you_replay_data
 
         # osu!topus should have played all notes perfectly (0 offset)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
 
-        score_types = score_data['type'].values
-        self.assertEqual(len(score_types[score_types == ManiaScoreData.TYPE_MISSP]), 0)
-        self.assertEqual(len(score_types[score_types == ManiaScoreData.TYPE_MISSR]), 0)
+        score_types = score_data['type'].to_numpy(dtype=np.int64)
+        replay_t    = score_data['replay_t'].to_numpy(dtype=np.float64)
+        map_t       = score_data['map_t'].to_numpy(dtype=np.float64)
+
+        self.assertEqual(np.count_nonzero(score_types == ManiaScoreData.TYPE_MISSP), 0)
+        self.assertEqual(np.count_nonzero(score_types == ManiaScoreData.TYPE_MISSR), 0)
 
         # Mania auto releases hold notes 1 ms early
-        offsets = (score_data['replay_t'] - score_data['map_t']).values
-        self.assertEqual(len(offsets[~((offsets == 0) | (offsets == -1))]), 0)
+        offsets = replay_t - map_t
+        self.assertTrue(((offsets == 0) | (offsets == -1)).all())
 
 
     def test_scoring_completeness(self):
@@ -64,98 +78,93 @@ class TestManiaScoreData(unittest.TestCase):
         replay_data = ManiaActionData.get_action_data(replay)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
 
-        map_score_xor = np.setxor1d(score_data['map_t'].values, ManiaActionData.press_times(map_data))  # Hits that are not present in either
-        map_score_xor = np.intersect1d(map_score_xor, ManiaActionData.press_times(map_data))            # Hits that are present in map but not score
-        self.assertEqual(len(map_score_xor), 0, f'Timings mising: {map_score_xor}')
+        map_presses = np.unique(ManiaActionData.press_times(map_data))
+        score_map_t = np.unique(score_data['map_t'].to_numpy(dtype=np.float64))
+
+        map_score_diff = np.setdiff1d(map_presses, score_map_t, assume_unique=True)  # Hits that are present in map but not score
+        self.assertEqual(len(map_score_diff), 0, f'Timings mising: {map_score_diff}')
 
 
     def test_scoring_integrity(self):
         # The number of hits + misses should match for all same maps
         beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/Goreshit - Satori De Pon! (SReisen) [Star Burst 2!].osu')
+        map_data = ManiaActionData.get_action_data(beatmap)
+        cols = range(ManiaActionData.num_keys(map_data))
 
-        def test(replay1_filename, replay2_filename, press_release):
-            replay1 = ReplayIO.open_replay(replay1_filename)
-            replay2 = ReplayIO.open_replay(replay2_filename)
+        # Some replays are compared against more than one other replay, so only process each replay once
+        @functools.lru_cache(maxsize=None)
+        def get_score_data(replay_filename):
+            replay = ReplayIO.open_replay(replay_filename)
+            return ManiaScoreData.get_score_data(map_data, ManiaActionData.get_action_data(replay))
 
-            map_data = ManiaActionData.get_action_data(beatmap)
-            score_data1 = ManiaScoreData.get_score_data(map_data, ManiaActionData.get_action_data(replay1))
-            score_data2 = ManiaScoreData.get_score_data(map_data, ManiaActionData.get_action_data(replay2))
+        def test(replay1_filename, replay2_filename):
+            score_data1 = get_score_data(replay1_filename)
+            score_data2 = get_score_data(replay2_filename)
 
-            hit_type  = ManiaScoreData.TYPE_HITP  if press_release == 1 else ManiaScoreData.TYPE_HITR
-            miss_type = ManiaScoreData.TYPE_MISSP if press_release == 1 else ManiaScoreData.TYPE_MISSR
+            score_types1 = score_data1['type'].to_numpy(dtype=np.int64)
+            score_types2 = score_data2['type'].to_numpy(dtype=np.int64)
 
-            for c in range(score_data1.shape[1]):
-                score_col1 = score_data1.loc[c]
-                score_col2 = score_data2.loc[c]
+            replay1_name = replay1_filename[replay1_filename.rfind("/") + 1:]
+            replay2_name = replay2_filename[replay2_filename.rfind("/") + 1:]
 
-                num_hits1 = score_col1['type'].values[score_col1['type'].values == hit_type].shape[0]
-                num_miss1 = score_col1['type'].values[score_col1['type'].values == miss_type].shape[0]
+            for press_release in [ 1, 0 ]:
+                with self.subTest(replay1=replay1_name, replay2=replay2_name, press_release=press_release):
+                    hit_type  = ManiaScoreData.TYPE_HITP  if press_release == 1 else ManiaScoreData.TYPE_HITR
+                    miss_type = ManiaScoreData.TYPE_MISSP if press_release == 1 else ManiaScoreData.TYPE_MISSR
 
-                num_hits2 = score_col2['type'].values[score_col2['type'].values == hit_type].shape[0]
-                num_miss2 = score_col2['type'].values[score_col2['type'].values == miss_type].shape[0]
+                    notes1 = score_data1[(score_types1 == hit_type) | (score_types1 == miss_type)]
+                    notes2 = score_data2[(score_types2 == hit_type) | (score_types2 == miss_type)]
 
-                hitp_t1 = score_col1['map_t'].values[score_col1['type'].values == hit_type]
-                miss_t1 = score_col1['map_t'].values[score_col1['type'].values == miss_type]
-                notes_t1 = np.concatenate((hitp_t1, miss_t1), axis=None).astype(int)  # All note timings in score 1
-                notes_t1 = np.sort(notes_t1)
+                    # Hit and miss counts of all columns in one pass; [ num_hits, num_miss ] per column
+                    counts1 = notes1.groupby(level=0)['type'].value_counts().unstack(fill_value=0).reindex(index=cols, columns=[ hit_type, miss_type ], fill_value=0).values
+                    counts2 = notes2.groupby(level=0)['type'].value_counts().unstack(fill_value=0).reindex(index=cols, columns=[ hit_type, miss_type ], fill_value=0).values
 
-                hitp_t2 = score_col2['map_t'].values[score_col2['type'].values == hit_type]
-                miss_t2 = score_col2['map_t'].values[score_col2['type'].values == miss_type]
-                notes_t2 = np.concatenate((hitp_t2, miss_t2), axis=None).astype(int)  # All note timings in score 2
-                notes_t2 = np.sort(notes_t2)
+                    # Note timings of hits and misses, split by column
+                    notes_col_t1 = { c : t.values for c, t in notes1['map_t'].groupby(level=0) }
+                    notes_col_t2 = { c : t.values for c, t in notes2['map_t'].groupby(level=0) }
 
-                notes_count1 = np.zeros(max(np.max(notes_t1), np.max(notes_t2)) + 1)
-                notes_count2 = np.zeros(max(np.max(notes_t1), np.max(notes_t2)) + 1)
+                    for c in cols:
+                        num_hits1, num_miss1 = counts1[c]
+                        num_hits2, num_miss2 = counts2[c]
 
-                notes_count1[:np.max(notes_t1)+1] = np.bincount(notes_t1)  # Integer histogram for timings of score 1
-                notes_count2[:np.max(notes_t2)+1] = np.bincount(notes_t2)  # Integer histogram for timings of score 2
-                notes_mismatch = np.arange(max(np.max(notes_t1), np.max(notes_t2)) + 1)[notes_count1 != notes_count2]
+                        if num_hits1 + num_miss1 == num_hits2 + num_miss2:
+                            continue
 
-                replay1_name = replay1_filename[replay1_filename.rfind("/") + 1:]
-                replay2_name = replay2_filename[replay2_filename.rfind("/") + 1:]
+                        # Mismatch details are only needed for the failure message
+                        notes_t1, notes_n1 = np.unique(notes_col_t1.get(c, np.empty(0)).astype(int), return_counts=True)  # Occurrences of note timings in score 1
+                        notes_t2, notes_n2 = np.unique(notes_col_t2.get(c, np.empty(0)).astype(int), return_counts=True)  # Occurrences of note timings in score 2
 
-                self.assertEqual(num_hits1 + num_miss1, num_hits2 + num_miss2,
-                    f'\n\tReplays: {replay1_name}    {replay2_name}\n'
-                    f'\tTest for {"Press" if press_release == 1 else "Release"}\n'
-                    f'\tOne of two maps have missing or extra scoring points at column {c}\n'
-                    f'\tScore 1 hits & misses: {num_hits1} + {num_miss1} = {num_hits1 + num_miss1}    score 2 hits & misses: {num_hits2} + {num_miss2} = {num_hits2 + num_miss2}\n'
-                    f'\tNote timings mismatched: {notes_mismatch}   score 1 occurences: {notes_count1[notes_count1 != notes_count2]}    score 2 occurences: {notes_count2[notes_count1 != notes_count2]}\n'
-                )
+                        # Line up occurrences of both scores on the timings present in either
+                        notes_t = np.union1d(notes_t1, notes_t2)
+                        notes_count1 = np.zeros(notes_t.shape[0], dtype=int)
+                        notes_count2 = np.zeros(notes_t.shape[0], dtype=int)
+                        notes_count1[np.searchsorted(notes_t, notes_t1)] = notes_n1
+                        notes_count2[np.searchsorted(notes_t, notes_t2)] = notes_n2
 
-        test(
-            'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-24) OsuMania.osr',
-            'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-24) OsuMania-1.osr',
-            press_release=1
-        )
+                        mismatch_mask  = notes_count1 != notes_count2
+                        notes_mismatch = notes_t[mismatch_mask]
 
-        test(
-            'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-24) OsuMania.osr',
-            'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-24) OsuMania-1.osr',
-            press_release=0
-        )
+                        self.fail(
+                            f'\n\tReplays: {replay1_name}    {replay2_name}\n'
+                            f'\tTest for {"Press" if press_release == 1 else "Release"}\n'
+                            f'\tOne of two maps have missing or extra scoring points at column {c}\n'
+                            f'\tScore 1 hits & misses: {num_hits1} + {num_miss1} = {num_hits1 + num_miss1}    score 2 hits & misses: {num_hits2} + {num_miss2} = {num_hits2 + num_miss2}\n'
+                            f'\tNote timings mismatched: {notes_mismatch}   score 1 occurences: {notes_count1[mismatch_mask]}    score 2 occurences: {notes_count2[mismatch_mask]}\n'
+                        )
 
         test(
             'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-24) OsuMania.osr',
-            'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-31) OsuMania.osr',
-            press_release=1
+            'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-24) OsuMania-1.osr',
         )
 
         test(
             'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-24) OsuMania.osr',
             'tests/data/replays/mania/abraker - Goreshit - Satori De Pon! [Star Burst 2!] (2021-07-31) OsuMania.osr',
-            press_release=0
         )
 
         test(
             'tests/data/replays/mania/abraker - Hyadain - Enemy Appearance! [NM] (2021-07-31) OsuMania-1.osr',
             'tests/data/replays/mania/abraker - Hyadain - Enemy Appearance! [NM] (2021-07-31) OsuMania.osr',
-            press_release=1
-        )
-
-        test(
-            'tests/data/replays/mania/abraker - Hyadain - Enemy Appearance! [NM] (2021-07-31) OsuMania-1.osr',
-            'tests/data/replays/mania/abraker - Hyadain - Enemy Appearance! [NM] (2021-07-31) OsuMania.osr',
-            press_release=0
         )
 
 
@@ -170,11 +179,8 @@ class TestManiaScoreData(unittest.TestCase):
 
 
     def test_press_interval_mean(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        replay = ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr')
-
-        map_data = ManiaActionData.get_action_data(beatmap)
-        replay_data = ManiaActionData.get_action_data(replay)
+        map_data = self.dear_you_map_data
+        replay_data = self.dear_you_replay_data
 
         # osu!topus should have played all notes perfectly (1 ms press intervals)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
@@ -182,94 +188,99 @@ class TestManiaScoreData(unittest.TestCase):
 
 
     def test_tap_offset_mean_0(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        replay = ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr')
-
-        map_data = ManiaActionData.get_action_data(beatmap)
-        replay_data = ManiaActionData.get_action_data(replay)
+        map_data = self.dear_you_map_data
+        replay_data = self.dear_you_replay_data
 
         # osu!topus should have played all notes perfectly (0 mean)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
 
         # Include only hits
-        score_data = score_data[score_data['type'] == ManiaScoreData.TYPE_HITP]
+        score_data = score_data[score_data['type'].to_numpy(dtype=np.int64) == ManiaScoreData.TYPE_HITP]
         tap_offset_mean = ManiaScoreData.tap_offset_mean(score_data)
         self.assertEqual(tap_offset_mean, 0)
 
 
     def test_tap_offset_mean_100(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
+        # Replay timings are modified, so it can't be the shared one
         replay = ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr')
 
         timings = replay.get_time_data()
         timings[0] += 100
 
-        map_data = ManiaActionData.get_action_data(beatmap)
+        map_data = self.dear_you_map_data
         replay_data = ManiaActionData.get_action_data(replay)
 
         # osu!topus should have played all notes perfectly (0 mean + 100 ms offset)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
 
         # Include only hits
-        score_data = score_data[score_data['type'] == ManiaScoreData.TYPE_HITP]
+        score_data = score_data[score_data['type'].to_numpy(dtype=np.int64) == ManiaScoreData.TYPE_HITP]
         tap_offset_mean = ManiaScoreData.tap_offset_mean(score_data)
         self.assertEqual(tap_offset_mean, 100)
 
 
     def test_tap_offset_mean_max(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
+        # Replay timings are modified, so it can't be the shared one
         replay = ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr')
 
         timings = replay.get_time_data()
         timings[0] += ManiaScoreData.pos_hit_range - 1
 
-        map_data = ManiaActionData.get_action_data(beatmap)
+        map_data = self.dear_you_map_data
         replay_data = ManiaActionData.get_action_data(replay)
 
         # osu!topus should have played all notes perfectly (0 mean + 150 ms offset)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
 
         # Include only hits
-        score_data = score_data[score_data['type'] == ManiaScoreData.TYPE_HITP]
+        score_data = score_data[score_data['type'].to_numpy(dtype=np.int64) == ManiaScoreData.TYPE_HITP]
         tap_offset_mean = ManiaScoreData.tap_offset_mean(score_data)
         self.assertEqual(tap_offset_mean, ManiaScoreData.pos_hit_range - 1)
 
 
     def test_tap_offset_var(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        replay = ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr')
-
-        map_data = ManiaActionData.get_action_data(beatmap)
-        replay_data = ManiaActionData.get_action_data(replay)
+        map_data = self.dear_you_map_data
+        replay_data = self.dear_you_replay_data
 
         # osu!topus should have played all notes perfectly (0 variance)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
 
         # Include only hits
-        score_data = score_data[score_data['type'] == ManiaScoreData.TYPE_HITP]
+        score_data = score_data[score_data['type'].to_numpy(dtype=np.int64) == ManiaScoreData.TYPE_HITP]
         tap_offset_var = ManiaScoreData.tap_offset_var(score_data)
         self.assertEqual(tap_offset_var, 0)
 
 
     def test_tap_offset_stdev(self):
-        beatmap = BeatmapIO.open_beatmap('tests/data/maps/mania/playable/DJ Genericname - Dear You (Taiwan-NAK) [S.Star\'s 4K HD+].osu')
-        replay = ReplayIO.open_replay('tests/data/replays/mania/osu!topus! - DJ Genericname - Dear You [S.Star\'s 4K HD+] (2019-05-29) OsuMania.osr')
-
-        map_data = ManiaActionData.get_action_data(beatmap)
-        replay_data = ManiaActionData.get_action_data(replay)
+        map_data = self.dear_you_map_data
+        replay_data = self.dear_you_replay_data
 
         # osu!topus should have played all notes perfectly (0 std dev)
         score_data = ManiaScoreData.get_score_data(map_data, replay_data)
 
         # Include only hits
-        score_data = score_data[score_data['type'] == ManiaScoreData.TYPE_HITP]
+        score_data = score_data[score_data['type'].to_numpy(dtype=np.int64) == ManiaScoreData.TYPE_HITP]
         tap_offset_stdev = ManiaScoreData.tap_offset_stdev(score_data)
         self.assertEqual(tap_offset_stdev, 0)
 
 
     def test_model_offset_prob(self):
-        # TODO
-        pass
+        # Far tails on either side of the mean must not cancel out to 0
+        for mean, stdev, offset in [ (0, 10, 16), (100, 10, 16), (200, 10, 10), (-100, 10, 16), (-200, 10, 10) ]:
+            if -offset > mean:
+                # Whole range is above the mean; upper tails of scipy's reference are exact there
+                expected = scipy.stats.norm.sf(-offset, loc=mean, scale=stdev) - scipy.stats.norm.sf(offset, loc=mean, scale=stdev)
+            else:
+                expected = scipy.stats.norm.cdf(offset, loc=mean, scale=stdev) - scipy.stats.norm.cdf(-offset, loc=mean, scale=stdev)
+
+            prob = ManiaScoreData.model_offset_prob(mean, stdev, offset)
+            self.assertGreater(prob, 0)
+            self.assertTrue(np.isclose(prob, expected, rtol=1e-9, atol=0), f'mean={mean} stdev={stdev} offset={offset}: {prob} != {expected}')
+
+        # Array of offsets is evaluated the same as each offset on its own
+        offsets = np.asarray([ 16.5, 40.5, 73.5, 103.5, 127.5 ])
+        probs = ManiaScoreData.model_offset_prob(-100, 10, offsets)
+        self.assertTrue(np.allclose(probs, [ ManiaScoreData.model_offset_prob(-100, 10, offset) for offset in offsets ], rtol=1e-12, atol=0))
 
 
     def test_odds_some_tap_within(self):
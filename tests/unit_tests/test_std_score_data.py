@@ -46,189 +46,240 @@ class TestStdScoreData(unittest.TestCase):
 
 
     def test_adv(self):
-        map_time = 0
+        map_values = self.map_data.values
+        adv_tables = StdScoreData._StdScoreData__adv_tables(map_values)
 
-        # Time:        Before start
-        # Hitobject:   Slider
-        # Advancement: No operation
-        adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 0)
+        # Index returned once there are no aimpoints left to advance to
+        map_idx_end = map_values.shape[0]
 
-        # Time:        Before start
-        # Hitobject:   Slider
-        # Advancement: Aimpoint
-        adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 100)
-
-        # Time:        Before start
-        # Hitobject:   Slider
-        # Advancement: Note
-        adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 100)
-
-        map_time = 100
+        map_idx = 0
 
         # Time:        At first aimpoint
         # Hitobject:   Slider
         # Advancement: No operation
         adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 100)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 0)
 
         # Time:        At first aimpoint
         # Hitobject:   Slider
         # Advancement: Aimpoint
         adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 350)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 1)
 
         # Time:        At first aimpoint
         # Hitobject:   Slider
         # Advancement: Note
         adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 1000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 4)
 
-        map_time = 350
+        map_idx = 1
 
         # Time:        At second aimpoint
         # Hitobject:   Slider
         # Advancement: No operation
         adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 350)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 1)
 
         # Time:        At second aimpoint
         # Hitobject:   Slider
         # Advancement: Aimpoint
         adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 600)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 2)
 
         # Time:        At second aimpoint
         # Hitobject:   Slider
         # Advancement: Note
         adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 1000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 4)
 
-        map_time = 750
+        map_idx = 3
 
         # Time:        At slider release
         # Hitobject:   Slider
         # Advancement: No operation
         adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 750)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 3)
 
         # Time:        At slider release
         # Hitobject:   Slider
         # Advancement: Aimpoint
         adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 1000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 4)
 
         # Time:        At slider release
         # Hitobject:   Slider
         # Advancement: Note
         adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 1000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 4)
 
-        map_time = 1000
+        map_idx = 4
 
         # Time:        At 2nd hitobject
         # Hitobject:   Circle
         # Advancement: No operation
         adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 1000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 4)
 
         # Time:        At 2nd hitobject
         # Hitobject:   Circle
         # Advancement: Aimpoint
         adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 1001)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 5)
 
         # Time:        At 2nd hitobject
         # Hitobject:   Circle
         # Advancement: Note
         adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 6)
 
-        map_time = 2000
+        map_idx = 6
 
         # Time:        At last hitobject
         # Hitobject:   Circle
         # Advancement: No operation
         adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 6)
 
         # Time:        At last hitobject
         # Hitobject:   Circle
         # Advancement: Aimpoint
         adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2001)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 7)
 
         # Time:        At last hitobject
         # Hitobject:   Circle
         # Advancement: Note
         adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2002)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
 
-        map_time = 2001
+        map_idx = 7
 
         # Time:        At last scorepoint
         # Hitobject:   Circle
         # Advancement: No operation
         adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2001)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 7)
 
-        # Time:        At last hitobject
+        # Time:        At last scorepoint
         # Hitobject:   Circle
         # Advancement: Aimpoint
         adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2002)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
 
-        # Time:        At last hitobject
+        # Time:        At last scorepoint
         # Hitobject:   Circle
         # Advancement: Note
         adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2002)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
 
-        map_time = 3000
+        map_idx = map_idx_end
 
-        # Time:        After last hitobject
-        # Hitobject:   Circle
+        # Time:        After last scorepoint
+        # Hitobject:   None
         # Advancement: No operation
         adv = StdScoreData._StdScoreData__ADV_NOP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 3000)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
+
+        # Time:        After last scorepoint
+        # Hitobject:   None
+        # Advancement: Aimpoint
+        adv = StdScoreData._StdScoreData__ADV_AIMP
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
 
-        # Time:        After last hitobject
+        # Time:        After last scorepoint
+        # Hitobject:   None
+        # Advancement: Note
+        adv = StdScoreData._StdScoreData__ADV_NOTE
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
+
+        # Slider overlapping the last listed circle. Once the circle is passed the map is
+        # exhausted by index, but the slider's later aimpoints are still ahead in time
+        map_values = np.asarray([
+            [ 100, 0,   0,   StdMapData.TYPE_PRESS,   StdMapData.TYPE_SLIDER ],
+            [ 350, 100, 0,   StdMapData.TYPE_HOLD,    StdMapData.TYPE_SLIDER ],
+            [ 600, 200, 0,   StdMapData.TYPE_HOLD,    StdMapData.TYPE_SLIDER ],
+            [ 750, 300, 0,   StdMapData.TYPE_RELEASE, StdMapData.TYPE_SLIDER ],
+            [ 500, 500, 500, StdMapData.TYPE_PRESS,   StdMapData.TYPE_CIRCLE ],
+            [ 501, 500, 500, StdMapData.TYPE_RELEASE, StdMapData.TYPE_CIRCLE ],
+        ], dtype=float)
+        adv_tables = StdScoreData._StdScoreData__adv_tables(map_values)
+        map_idx_end = map_values.shape[0]
+
+        map_idx = 4
+
+        # Time:        At overlapped circle
         # Hitobject:   Circle
         # Advancement: Aimpoint
         adv = StdScoreData._StdScoreData__ADV_AIMP
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2002)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 2)
 
-        # Time:        After last hitobject
+        # Time:        At overlapped circle
         # Hitobject:   Circle
         # Advancement: Note
         adv = StdScoreData._StdScoreData__ADV_NOTE
-        new_map_time = StdScoreData._StdScoreData__adv(self.map_data, map_time, adv)
-        self.assertEqual(new_map_time, 2002)
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
+
+        map_idx = map_idx_end
+
+        # Time:        After overlapped circle
+        # Hitobject:   None
+        # Advancement: No operation
+        adv = StdScoreData._StdScoreData__ADV_NOP
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
+
+        # Time:        After overlapped circle
+        # Hitobject:   None
+        # Advancement: Aimpoint
+        adv = StdScoreData._StdScoreData__ADV_AIMP
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, 2)
+
+        # Time:        After overlapped circle
+        # Hitobject:   None
+        # Advancement: Note
+        adv = StdScoreData._StdScoreData__ADV_NOTE
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
+
+        map_idx = 3
+
+        # Time:        At slider release
+        # Hitobject:   Slider
+        # Advancement: Aimpoint
+        adv = StdScoreData._StdScoreData__ADV_AIMP
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
+
+        # Time:        At slider release
+        # Hitobject:   Slider
+        # Advancement: Note
+        adv = StdScoreData._StdScoreData__ADV_NOTE
+        new_map_idx = StdScoreData._StdScoreData__adv(adv_tables, map_idx, adv)
+        self.assertEqual(new_map_idx, map_idx_end)
 
 
     def test_nm_map(self):
@@ -284,6 +335,60 @@ class TestStdScoreData(unittest.TestCase):
         miss_count = np.count_nonzero(score_data['type'].values == StdScoreData.TYPE_MISS)
         self.assertTrue(miss_count == 1)
 
+
+    def test_get_score_data_overlapping(self):
+        # Slider overlapping the last listed circle
+        map_data = [
+            pd.DataFrame(
+            [
+                [ 1000, 100, 100, StdMapData.TYPE_PRESS, StdMapData.TYPE_SLIDER ],
+                [ 1100, 150, 100, StdMapData.TYPE_HOLD, StdMapData.TYPE_SLIDER ],
+                [ 1200, 200, 100, StdMapData.TYPE_HOLD, StdMapData.TYPE_SLIDER ],
+                [ 1300, 250, 100, StdMapData.TYPE_HOLD, StdMapData.TYPE_SLIDER ],
+                [ 1400, 300, 100, StdMapData.TYPE_RELEASE, StdMapData.TYPE_SLIDER ],
+            ],
+            columns=['time', 'x', 'y', 'type', 'object']),
+            pd.DataFrame(
+            [
+                [ 1150, 400, 300, StdMapData.TYPE_PRESS, StdMapData.TYPE_CIRCLE ],
+                [ 1151, 400, 300, StdMapData.TYPE_RELEASE, StdMapData.TYPE_CIRCLE ],
+            ],
+            columns=['time', 'x', 'y', 'type', 'object']),
+        ]
+        map_data = pd.concat(map_data, axis=0, keys=range(len(map_data)), names=[ 'hitobject', 'aimpoint' ])
+
+        # Both presses are too late and miss the slider start and the circle. The map is then
+        # exhausted by index, but the slider's remaining aimpoints are still held on.
+        replay_data = pd.DataFrame(
+        [
+            [  900, 100, 100, 0, 0, StdReplayData.FREE,    0, 0 ],
+            [ 1230, 100, 100, 0, 0, StdReplayData.PRESS,   0, 0 ],
+            [ 1250, 100, 100, 0, 0, StdReplayData.RELEASE, 0, 0 ],
+            [ 1380, 400, 300, 0, 0, StdReplayData.PRESS,   0, 0 ],
+            [ 1400, 300, 100, 0, 0, StdReplayData.HOLD,    0, 0 ],
+            [ 1450, 300, 100, 0, 0, StdReplayData.HOLD,    0, 0 ],
+            [ 1500, 300, 100, 0, 0, StdReplayData.HOLD,    0, 0 ],
+            [ 1550, 300, 100, 0, 0, StdReplayData.HOLD,    0, 0 ],
+            [ 1600, 300, 100, 0, 0, StdReplayData.HOLD,    0, 0 ],
+            [ 1650, 300, 100, 0, 0, StdReplayData.RELEASE, 0, 0 ],
+        ],
+        columns=[ 'time', 'x', 'y', 'm1', 'm2', 'k1', 'k2', 'smoke' ])
+
+        score_data = StdScoreData.get_score_data(replay_data, map_data)
+
+        # Same as the time based scoring loop records for this play
+        expected = np.asarray([
+            # replay_t, map_t, type, action
+            [ 1230, 1000, StdScoreData.TYPE_MISS, StdScoreData.ACTION_PRESS ],
+            [ 1380, 1150, StdScoreData.TYPE_MISS, StdScoreData.ACTION_PRESS ],
+            [ 1400, 1200, StdScoreData.TYPE_AIMH, StdScoreData.ACTION_HOLD ],
+            [ 1450, 1200, StdScoreData.TYPE_AIMH, StdScoreData.ACTION_HOLD ],
+            [ 1500, 1300, StdScoreData.TYPE_AIMH, StdScoreData.ACTION_HOLD ],
+            [ 1650, 1400, StdScoreData.TYPE_HITR, StdScoreData.ACTION_RELEASE ],
+        ])
+
+        np.testing.assert_array_equal(score_data[[ 'replay_t', 'map_t', 'type', 'action' ]].values, expected)
+
     """
     def test_process_press(self):
         settings = StdScoreData.Settings()
@@ -5,6 +5,17 @@ from osu_analysis import StdMapData
 from osu_analysis import StdScoreData
 
 
+def process_free(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
+    # The scoring loop freezes the settings and computes the offsets to the aimpoint being processed; do the same here
+    settings = StdScoreData._StdScoreData__freeze_settings(settings)
+    aimpoint = aimpoints[0]
+    time_offset = replay_time - aimpoint[StdMapData.IDX_TIME]
+    posx_offset = replay_xpos - aimpoint[StdMapData.IDX_X]
+    posy_offset = replay_ypos - aimpoint[StdMapData.IDX_Y]
+
+    return StdScoreData._StdScoreData__process_free(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
+
+
 
 class TestStdScoreDataFree(unittest.TestCase):
 
@@ -59,11 +70,14 @@ class TestStdScoreDataFree(unittest.TestCase):
 
                     # Time:     0 ms -> 3000 ms
                     # Scoring:  Awaiting press at slider start (100 ms @ (0, 0))
+                    map_values = self.map_data.values
+                    map_time   = self.map_data.iloc[0]['time']
+
                     for ms in range(0, 3000):
-                        score_data = {}
+                        score_data = StdScoreData._ScoreBuf(1)
 
-                        adv = StdScoreData._StdScoreData__process_free(settings, score_data, self.map_data.values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                        offset = ms - self.map_data.iloc[0]['time']
+                        adv = process_free(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                        offset = ms - map_time
 
                         def proc_required():
                             # Regardless of whether aim is required, a tap is required and this got a free instead
@@ -72,7 +86,7 @@ class TestStdScoreDataFree(unittest.TestCase):
                                 self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
                             else:
                                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
                         def proc_required_non():
                             if offset < 0:
@@ -80,7 +94,7 @@ class TestStdScoreDataFree(unittest.TestCase):
                                 self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
                             else:
                                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
+                                self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
 
                         if not require_aim_press and not require_tap_press:
                             # No need to tap or aim; Automatic freebie
@@ -126,16 +140,19 @@ class TestStdScoreDataFree(unittest.TestCase):
                                 settings.miss_slider         = slider_miss
 
                                 # Set hitwindow ranges to what these tests have been written for
-                                self.neg_hld_range = 0
-                                self.pos_hld_range = 1000
+                                settings.neg_hld_range = 0
+                                settings.pos_hld_range = 1000
 
                                 # Time:     0 ms -> 3000 ms
                                 # Scoring:  Awaiting hold at slider aimpoint (350 ms @ (100, 0))
+                                map_values = self.map_data.iloc[1:].values
+                                map_time   = self.map_data.iloc[1]['time']
+
                                 for ms in range(0, 3000):
-                                    score_data = {}
+                                    score_data = StdScoreData._ScoreBuf(1)
 
-                                    adv = StdScoreData._StdScoreData__process_free(settings, score_data, self.map_data.iloc[1:].values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                                    offset = ms - self.map_data.iloc[1]['time']
+                                    adv = process_free(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                                    offset = ms - map_time
 
                                     expected_miss_adv = StdScoreData._StdScoreData__ADV_NOTE if slider_miss else StdScoreData._StdScoreData__ADV_AIMP
                                     expected_late_timing = settings.pos_hld_range if recoverable_release else 0
@@ -146,7 +163,7 @@ class TestStdScoreDataFree(unittest.TestCase):
                                             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
                                         else:
                                             self.assertEqual(adv, expected_miss_adv, f'Offset: {offset} ms  recoverable_missaim: {recoverable_missaim}  recoverable_release: {recoverable_release}   expected_late_timing: {expected_late_timing}')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
                                     def proc_required_non():
                                         if offset < 0:
@@ -154,7 +171,7 @@ class TestStdScoreDataFree(unittest.TestCase):
                                             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
                                         else:
                                             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_AIMP, f'Offset: {offset} ms')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_AIMH, f'Offset: {offset} ms')
+                                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_AIMH, f'Offset: {offset} ms')
 
                                     if not require_aim_hold and not require_tap_hold:
                                         # No need to tap or aim; Automatic freebie
@@ -199,11 +216,14 @@ class TestStdScoreDataFree(unittest.TestCase):
 
                     # Time:     0 ms -> 3000 ms
                     # Scoring:  Awaiting release at slider end (750 ms @ (300, 0))
+                    map_values = self.map_data.iloc[3:].values
+                    map_time   = self.map_data.iloc[3]['time']
+
                     for ms in range(0, 3000):
-                        score_data = {}
+                        score_data = StdScoreData._ScoreBuf(1)
 
-                        adv = StdScoreData._StdScoreData__process_free(settings, score_data, self.map_data.iloc[3:].values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                        offset = ms - self.map_data.iloc[3]['time']
+                        adv = process_free(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                        offset = ms - map_time
 
                         def proc_required():
                             if offset <= settings.pos_rel_miss_range:
@@ -211,7 +231,7 @@ class TestStdScoreDataFree(unittest.TestCase):
                                 self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
                             else:
                                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
                         def proc_required_non():
                             if offset < 0:
@@ -219,7 +239,7 @@ class TestStdScoreDataFree(unittest.TestCase):
                                 self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
                             else:
                                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITR, f'Offset: {offset} ms')
+                                self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITR, f'Offset: {offset} ms')
 
                         if not require_aim_release and not require_tap_release:
                             # No need to tap or aim; Automatic freebie
@@ -262,18 +282,21 @@ class TestStdScoreDataFree(unittest.TestCase):
         # Time:     0 ms -> 3000 ms
         # Location: Blank area (1000, 1000)
         # Scoring:  Awaiting press at 1st hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+        map_time   = self.map_data.iloc[4]['time']
+
         for ms in range(0, 3000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_free(settings, score_data, self.map_data.iloc[4:].values, ms, 1000, 1000, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_free(settings, score_data, map_values, ms, 1000, 1000, [0, 0])
 
-            offset = ms - self.map_data.iloc[4]['time']
+            offset = ms - map_time
 
             if offset <= settings.pos_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
                 self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
             else:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
 
     def test_circle_nomisaim(self):
@@ -293,15 +316,18 @@ class TestStdScoreDataFree(unittest.TestCase):
         # Time:     0 ms -> 3000 ms
         # Location: At 1st hitcircle (500, 500)
         # Scoring:  Awaiting press at 1st hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+        map_time   = self.map_data.iloc[4]['time']
+
         for ms in range(0, 3000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_free(settings, score_data, self.map_data.iloc[4:].values, ms, 500, 500, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_free(settings, score_data, map_values, ms, 500, 500, [0, 0])
 
-            offset = ms - self.map_data.iloc[4]['time']
+            offset = ms - map_time
 
             if offset <= settings.pos_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
                 self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
             else:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
@@ -5,6 +5,17 @@ from osu_analysis import StdMapData
 from osu_analysis import StdScoreData
 
 
+def process_hold(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
+    # The scoring loop freezes the settings and computes the offsets to the aimpoint being processed; do the same here
+    settings = StdScoreData._StdScoreData__freeze_settings(settings)
+    aimpoint = aimpoints[0]
+    time_offset = replay_time - aimpoint[StdMapData.IDX_TIME]
+    posx_offset = replay_xpos - aimpoint[StdMapData.IDX_X]
+    posy_offset = replay_ypos - aimpoint[StdMapData.IDX_Y]
+
+    return StdScoreData._StdScoreData__process_hold(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
+
+
 
 class TestStdScoreDataHold(unittest.TestCase):
 
@@ -59,11 +70,14 @@ class TestStdScoreDataHold(unittest.TestCase):
 
                     # Time:     0 ms -> 3000 ms
                     # Scoring:  Awaiting press at slider start (100 ms @ (0, 0))
+                    map_values = self.map_data.values
+                    map_time   = self.map_data.iloc[0]['time']
+
                     for ms in range(0, 3000):
-                        score_data = {}
+                        score_data = StdScoreData._ScoreBuf(1)
 
-                        adv = StdScoreData._StdScoreData__process_hold(settings, score_data, self.map_data.values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                        offset = ms - self.map_data.iloc[0]['time']
+                        adv = process_hold(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                        offset = ms - map_time
 
                         # Regardless of anythingg a tap is required and this got a hold instead
                         self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -87,16 +101,19 @@ class TestStdScoreDataHold(unittest.TestCase):
                             settings.miss_slider         = slider_miss
 
                             # Set hitwindow ranges to what these tests have been written for
-                            self.neg_hld_range = 50
-                            self.pos_hld_range = 1000
+                            settings.neg_hld_range = 50
+                            settings.pos_hld_range = 1000
 
                             # Time:     0 ms -> 3000 ms
                             # Scoring:  Awaiting hold at slider aimpoint (350 ms @ (100, 0))
+                            map_values = self.map_data.iloc[1:].values
+                            map_time   = self.map_data.iloc[1]['time']
+
                             for ms in range(0, 3000):
-                                score_data = {}
+                                score_data = StdScoreData._ScoreBuf(1)
 
-                                adv = StdScoreData._StdScoreData__process_hold(settings, score_data, self.map_data.iloc[1:].values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                                offset = ms - self.map_data.iloc[1]['time']
+                                adv = process_hold(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                                offset = ms - map_time
 
                                 expected_miss_adv = StdScoreData._StdScoreData__ADV_NOTE if slider_miss else StdScoreData._StdScoreData__ADV_AIMP
 
@@ -107,7 +124,7 @@ class TestStdScoreDataHold(unittest.TestCase):
 
                                     if -settings.neg_hld_range < offset <= settings.pos_hld_range:
                                         self.assertEqual(adv, StdScoreData._StdScoreData__ADV_AIMP, f'Offset: {offset} ms')
-                                        self.assertEqual(score_data[0][6], StdScoreData.TYPE_AIMH, f'Offset: {offset} ms')
+                                        self.assertEqual(score_data.type[0], StdScoreData.TYPE_AIMH, f'Offset: {offset} ms')
 
                                     if settings.pos_hld_range < offset:
                                         self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -117,7 +134,7 @@ class TestStdScoreDataHold(unittest.TestCase):
                                     if settings.recoverable_missaim:
                                         if settings.pos_hld_range < offset:
                                             self.assertEqual(adv, expected_miss_adv, f'Offset: {offset} ms')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
                                         else:
                                             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
                                             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
@@ -128,7 +145,7 @@ class TestStdScoreDataHold(unittest.TestCase):
                                         self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
                                     else:
                                         self.assertEqual(adv, StdScoreData._StdScoreData__ADV_AIMP, f'Offset: {offset} ms')
-                                        self.assertEqual(score_data[0][6], StdScoreData.TYPE_AIMH, f'Offset: {offset} ms')
+                                        self.assertEqual(score_data.type[0], StdScoreData.TYPE_AIMH, f'Offset: {offset} ms')
 
                                 if not require_aim_hold and not require_tap_hold:
                                     # No need to tap or aim; Automatic freebie
@@ -166,11 +183,14 @@ class TestStdScoreDataHold(unittest.TestCase):
         # Time:     0 ms -> 3000 ms
         # Location: At slider release (300, 0)
         # Scoring:  Awaiting release at slider end (750 ms @ (300, 0))
+        map_values = self.map_data.iloc[3:].values
+        map_time   = self.map_data.iloc[3]['time']
+
         for ms in range(0, 3000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_hold(settings, score_data, self.map_data.iloc[3:].values, ms, 300, 0, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_hold(settings, score_data, map_values, ms, 300, 0, [0, 0])
 
-            offset = ms - self.map_data.iloc[3]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
@@ -199,11 +219,14 @@ class TestStdScoreDataHold(unittest.TestCase):
         # Time:     0 ms -> 3000 ms
         # Location: At 1st hitcircle (500, 500)
         # Scoring:  Awaiting press at 1st hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+        map_time   = self.map_data.iloc[4]['time']
+
         for ms in range(0, 3000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_hold(settings, score_data, self.map_data.iloc[4:].values, ms, 500, 500, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_hold(settings, score_data, map_values, ms, 500, 500, [0, 0])
 
-            offset = ms - self.map_data.iloc[4]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
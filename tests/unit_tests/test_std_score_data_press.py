@@ -5,6 +5,17 @@ from osu_analysis import StdMapData
 from osu_analysis import StdScoreData
 
 
+def process_press(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
+    # The scoring loop freezes the settings and computes the offsets to the aimpoint being processed; do the same here
+    settings = StdScoreData._StdScoreData__freeze_settings(settings)
+    aimpoint = aimpoints[0]
+    time_offset = replay_time - aimpoint[StdMapData.IDX_TIME]
+    posx_offset = replay_xpos - aimpoint[StdMapData.IDX_X]
+    posy_offset = replay_ypos - aimpoint[StdMapData.IDX_Y]
+
+    return StdScoreData._StdScoreData__process_press(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
+
+
 
 class TestStdScoreDataPress(unittest.TestCase):
 
@@ -69,11 +80,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Behavior:
         #   Scorepoint awaits PRESS -> NOP
         #   -> NOP
+        map_values = self.map_data.values
+        map_time   = self.map_data.iloc[0]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.values, ms, 1000, 1000, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 1000, 1000, [0, 0])
 
-            offset = ms - self.map_data.iloc[0]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
@@ -97,11 +111,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Time:     -1000 ms -> 4000 ms
         # Location: At slider start (0, 0)
         # Scoring:  Awaiting press at slider start (100 ms @ (0, 0))
+        map_values = self.map_data.values
+        map_time   = self.map_data.iloc[0]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.values, ms, 0, 0, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 0, 0, [0, 0])
 
-            offset = ms - self.map_data.iloc[0]['time']
+            offset = ms - map_time
 
             if offset <= -settings.neg_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -109,15 +126,15 @@ class TestStdScoreDataPress(unittest.TestCase):
 
             elif -settings.neg_hit_miss_range < offset <= -settings.neg_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif -settings.neg_hit_range < offset <= settings.pos_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_AIMP, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
 
             elif settings.pos_hit_range < offset <= settings.pos_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif settings.pos_hit_miss_range < offset:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -145,11 +162,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Time:     -1000 ms -> 4000 ms
         # Location: Blank area (1000, 1000)
         # Scoring:  Awaiting hold at scorepoint (350 ms @ (100, 0))
+        map_values = self.map_data.iloc[1:].values
+        map_time   = self.map_data.iloc[1]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.iloc[1:].values, ms, 1000, 1000, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 1000, 1000, [0, 0])
 
-            offset = ms - self.map_data.iloc[1]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
@@ -173,11 +193,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Time:     -1000 ms -> 4000 ms
         # Location: At scorepoint (100, 0)
         # Scoring:  Awaiting hold at scorepoint (350 ms @ (100, 0))
+        map_values = self.map_data.iloc[1:].values
+        map_time   = self.map_data.iloc[1]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.iloc[1:].values, ms, 100, 0, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 100, 0, [0, 0])
 
-            offset = ms - self.map_data.iloc[1]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
@@ -201,11 +224,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Time:     -1000 ms -> 4000 ms
         # Location: Blank area (1000, 1000)
         # Scoring:  Awaiting press at hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+        map_time   = self.map_data.iloc[4]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.iloc[4:].values, ms, 1000, 1000, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 1000, 1000, [0, 0])
 
-            offset = ms - self.map_data.iloc[4]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
@@ -223,11 +249,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Time:     -1000 ms -> 4000 ms
         # Location: On hit circle (500, 500)
         # Scoring:  Awaiting press at hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+        map_time   = self.map_data.iloc[4]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.iloc[4:].values, ms, 500, 500, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 500, 500, [0, 0])
 
-            offset = ms - self.map_data.iloc[4]['time']
+            offset = ms - map_time
 
             if offset <= -settings.neg_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -235,16 +264,16 @@ class TestStdScoreDataPress(unittest.TestCase):
 
             elif -settings.neg_hit_miss_range < offset <= -settings.neg_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif -settings.neg_hit_range < offset <= settings.pos_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][0] - score_data[0][1], offset, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
+                self.assertEqual(score_data.replay_t[0] - score_data.map_t[0], offset, f'Offset: {offset} ms')
 
             elif settings.pos_hit_range < offset <= settings.pos_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif settings.pos_hit_miss_range < offset:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -272,14 +301,37 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Time:     -1000 ms -> 4000 ms
         # Location: Blank area (1000, 1000)
         # Scoring:  Awaiting press at hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+        map_time   = self.map_data.iloc[4]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.iloc[4:].values, ms, 1000, 1000, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 1000, 1000, [0, 0])
 
-            offset = ms - self.map_data.iloc[4]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
-            self.assertEqual(score_data[0][6], StdScoreData.TYPE_EMPTY)
+            self.assertEqual(score_data.type[0], StdScoreData.TYPE_EMPTY)
+
+
+    def test_circle_press_nan_offset__blank(self):
+        settings = StdScoreData.Settings()
+        settings.blank_miss = True
+
+        # Time:     NaN
+        # Location: At 1st hit circle (500, 500)
+        # Scoring:  Awaiting press at hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+
+        for require_tap_press in [True, False]:
+            settings.require_tap_press = require_tap_press
+
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, float('nan'), 500, 500, [0, 0])
+
+            # A NaN offset is in no timing window, so nothing is recorded
+            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP)
+            self.assertEqual(len(score_data), 0)
 
 
     def test_circle_press_nomissaim__noblank(self):
@@ -300,11 +352,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Time:     -1000 ms -> 4000 ms
         # Location: At 1st hit circle (500, 500)
         # Scoring:  Awaiting press at hitcircle (1000 ms @ (500, 500))
+        map_values = self.map_data.iloc[4:].values
+        map_time   = self.map_data.iloc[4]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.iloc[4:].values, ms, 500, 500, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 500, 500, [0, 0])
 
-            offset = ms - self.map_data.iloc[4]['time']
+            offset = ms - map_time
 
             if offset <= -settings.neg_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -312,15 +367,15 @@ class TestStdScoreDataPress(unittest.TestCase):
 
             elif -settings.neg_hit_miss_range < offset <= -settings.neg_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif -settings.neg_hit_range < offset <= settings.pos_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
 
             elif settings.pos_hit_range < offset <= settings.pos_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif settings.pos_hit_miss_range < offset:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -349,11 +404,14 @@ class TestStdScoreDataPress(unittest.TestCase):
         # Location: At 2st slider (500, 500)
         # Scoring:  Awaiting press at slider (3100 ms @ (0, 0))
 
+        map_values = self.map_data.iloc[8:].values
+        map_time   = self.map_data.iloc[8]['time']
+
         for ms in range(-1000, 4000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_press(settings, score_data, self.map_data.iloc[8:].values, ms, 0, 0, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_press(settings, score_data, map_values, ms, 0, 0, [0, 0])
 
-            offset = ms - self.map_data.iloc[8]['time']
+            offset = ms - map_time
 
             if offset <= -settings.neg_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -361,15 +419,15 @@ class TestStdScoreDataPress(unittest.TestCase):
 
             elif -settings.neg_hit_miss_range < offset <= -settings.neg_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif -settings.neg_hit_range < offset <= settings.pos_hit_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_AIMP, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITP, f'Offset: {offset} ms')
 
             elif settings.pos_hit_range < offset <= settings.pos_hit_miss_range:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
 
             elif settings.pos_hit_miss_range < offset:
                 self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
@@ -1,38 +1,38 @@
 import unittest
-import pandas as pd
+import itertools
+import numpy as np
 
 from osu_analysis import StdMapData
 from osu_analysis import StdScoreData
 
 
+def process_release(settings, score_data, aimpoints, replay_time, replay_xpos, replay_ypos, last_tap_pos):
+    # The scoring loop freezes the settings and computes the offsets to the aimpoint being processed; do the same here
+    settings = StdScoreData._StdScoreData__freeze_settings(settings)
+    aimpoint = aimpoints[0]
+    time_offset = replay_time - aimpoint[StdMapData.IDX_TIME]
+    posx_offset = replay_xpos - aimpoint[StdMapData.IDX_X]
+    posy_offset = replay_ypos - aimpoint[StdMapData.IDX_Y]
+
+    return StdScoreData._StdScoreData__process_release(settings, score_data, aimpoint, replay_time, replay_xpos, replay_ypos, time_offset, posx_offset, posy_offset, last_tap_pos)
+
+
 
 class TestStdScoreDataRelease(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        map_data = [
-            pd.DataFrame(
-            [
-                [ 100, 0,   0, StdMapData.TYPE_PRESS, StdMapData.TYPE_SLIDER ],
-                [ 350, 100, 0, StdMapData.TYPE_HOLD, StdMapData.TYPE_SLIDER ],
-                [ 600, 200, 0, StdMapData.TYPE_HOLD, StdMapData.TYPE_SLIDER ],
-                [ 750, 300, 0, StdMapData.TYPE_RELEASE, StdMapData.TYPE_SLIDER ],
-            ],
-            columns=['time', 'x', 'y', 'type', 'object']),
-            pd.DataFrame(
-            [
-                [ 1000, 500, 500, StdMapData.TYPE_PRESS, StdMapData.TYPE_CIRCLE ],
-                [ 1001, 500, 500, StdMapData.TYPE_RELEASE, StdMapData.TYPE_CIRCLE ],
-            ],
-            columns=['time', 'x', 'y', 'type', 'object']),
-            pd.DataFrame(
-            [
-                [ 2000, 300, 300, StdMapData.TYPE_PRESS, StdMapData.TYPE_CIRCLE ],
-                [ 2001, 300, 300, StdMapData.TYPE_RELEASE, StdMapData.TYPE_CIRCLE ],
-            ],
-            columns=['time', 'x', 'y', 'type', 'object']),
-        ]
-        cls.map_data = pd.concat(map_data, axis=0, keys=range(len(map_data)), names=[ 'hitobject', 'aimpoint' ])
+        cls.map_values = np.array([
+            [ 100,  0,   0,   StdMapData.TYPE_PRESS,   StdMapData.TYPE_SLIDER ],
+            [ 350,  100, 0,   StdMapData.TYPE_HOLD,    StdMapData.TYPE_SLIDER ],
+            [ 600,  200, 0,   StdMapData.TYPE_HOLD,    StdMapData.TYPE_SLIDER ],
+            [ 750,  300, 0,   StdMapData.TYPE_RELEASE, StdMapData.TYPE_SLIDER ],
+            [ 1000, 500, 500, StdMapData.TYPE_PRESS,   StdMapData.TYPE_CIRCLE ],
+            [ 1001, 500, 500, StdMapData.TYPE_RELEASE, StdMapData.TYPE_CIRCLE ],
+            [ 2000, 300, 300, StdMapData.TYPE_PRESS,   StdMapData.TYPE_CIRCLE ],
+            [ 2001, 300, 300, StdMapData.TYPE_RELEASE, StdMapData.TYPE_CIRCLE ],
+        ], dtype=np.float64)
+        cls.map_values.flags.writeable = False  # Shared by all tests; must not be modified by them
 
 
     @classmethod
@@ -43,176 +43,175 @@ class TestStdScoreDataRelease(unittest.TestCase):
     def test_slider_start(self):
         settings = StdScoreData.Settings()
 
-        for require_tap_release in [True, False]:
-            for require_aim_release in [True, False]:
-                for recoverable_release in [True, False]:
-                    for miss_aim in [True, False]:
-                        cursor_xy = [500, 500] if miss_aim else [0, 0]
+        for require_tap_release, require_aim_release, recoverable_release, miss_aim in itertools.product([True, False], repeat=4):
+            with self.subTest(require_tap_release=require_tap_release, require_aim_release=require_aim_release, recoverable_release=recoverable_release, miss_aim=miss_aim):
+                cursor_xy = [500, 500] if miss_aim else [0, 0]
 
-                        settings.require_tap_release = require_tap_release
-                        settings.require_aim_release = require_aim_release
+                settings.require_tap_release = require_tap_release
+                settings.require_aim_release = require_aim_release
 
-                        # Set hitwindow ranges to what these tests have been written for
-                        settings.neg_rel_miss_range = 450    # ms point of early miss window
-                        settings.neg_rel_range      = 300    # ms point of early release window
-                        settings.pos_rel_range      = 300    # ms point of late release window
-                        settings.pos_rel_miss_range = 450    # ms point of late miss window
+                # Set hitwindow ranges to what these tests have been written for
+                settings.neg_rel_miss_range = 450    # ms point of early miss window
+                settings.neg_rel_range      = 300    # ms point of early release window
+                settings.pos_rel_range      = 300    # ms point of late release window
+                settings.pos_rel_miss_range = 450    # ms point of late miss window
 
-                        # Time:     0 ms -> 3000 ms
-                        # Scoring:  Awaiting press at slider start (100 ms @ (0, 0))
-                        for ms in range(0, 3000):
-                            score_data = {}
+                # Time:     0 ms -> 3000 ms
+                # Scoring:  Awaiting press at slider start (100 ms @ (0, 0))
+                map_values = self.map_values
+                map_time   = self.map_values[0, StdMapData.IDX_TIME]
 
-                            adv = StdScoreData._StdScoreData__process_release(settings, score_data, self.map_data.values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                            offset = ms - self.map_data.iloc[0]['time']
+                for ms in range(0, 3000):
+                    score_data = StdScoreData._ScoreBuf(1)
 
-                            # Regardless of anythingg a tap is required and this got a release instead
-                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
-                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
+                    adv = process_release(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                    offset = ms - map_time
+
+                    # Regardless of anythingg a tap is required and this got a release instead
+                    self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
+                    self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
 
 
     def test_slider_hold(self):
         settings = StdScoreData.Settings()
 
-        for require_tap_release in [True, False]:
-            for require_aim_release in [True, False]:
-                for require_tap_hold in [True, False]:
-                    for recoverable_release in [True, False]:
-                        for slider_miss in [True, False]:
-                            for miss_aim in [True, False]:
-                                cursor_xy = [1000, 1000] if miss_aim else [0, 0]
-
-                                settings.require_tap_hold    = require_tap_hold
-                                settings.require_tap_release = require_tap_release
-                                settings.require_aim_release = require_aim_release
-
-                                settings.recoverable_release = recoverable_release
-                                settings.miss_slider         = slider_miss
-
-                                # Set hitwindow ranges to what these tests have been written for
-                                settings.neg_rel_miss_range = 450    # ms point of early miss window
-                                settings.neg_rel_range      = 300    # ms point of early release window
-                                settings.pos_rel_range      = 300    # ms point of late release window
-                                settings.pos_rel_miss_range = 450    # ms point of late miss window
-
-                                # Set hitwindow ranges to what these tests have been written for
-                                self.neg_hld_range = 0
-                                self.pos_hld_range = 1000
-
-                                # Time:     0 ms -> 3000 ms
-                                # Scoring:  Awaiting hold at slider aimpoint (350 ms @ (100, 0))
-                                for ms in range(0, 3000):
-                                    score_data = {}
-
-                                    adv = StdScoreData._StdScoreData__process_release(settings, score_data, self.map_data.iloc[1:].values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                                    offset = ms - self.map_data.iloc[1]['time']
-
-                                    expected_miss_adv = StdScoreData._StdScoreData__ADV_NOTE if slider_miss else StdScoreData._StdScoreData__ADV_AIMP
-
-                                    if require_tap_hold:
-                                        if recoverable_release:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
-                                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
-                                        else:
-                                            self.assertEqual(adv, expected_miss_adv, f'Offset: {offset} ms')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
-                                    else:
-                                        # No need to tap
-                                        self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
-                                        self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
+        for require_tap_release, require_aim_release, require_tap_hold, recoverable_release, slider_miss, miss_aim in itertools.product([True, False], repeat=6):
+            with self.subTest(require_tap_release=require_tap_release, require_aim_release=require_aim_release, require_tap_hold=require_tap_hold, recoverable_release=recoverable_release, slider_miss=slider_miss, miss_aim=miss_aim):
+                cursor_xy = [1000, 1000] if miss_aim else [0, 0]
+
+                settings.require_tap_hold    = require_tap_hold
+                settings.require_tap_release = require_tap_release
+                settings.require_aim_release = require_aim_release
+
+                settings.recoverable_release = recoverable_release
+                settings.miss_slider         = slider_miss
+
+                # Set hitwindow ranges to what these tests have been written for
+                settings.neg_rel_miss_range = 450    # ms point of early miss window
+                settings.neg_rel_range      = 300    # ms point of early release window
+                settings.pos_rel_range      = 300    # ms point of late release window
+                settings.pos_rel_miss_range = 450    # ms point of late miss window
+
+                # Set hitwindow ranges to what these tests have been written for
+                settings.neg_hld_range = 0
+                settings.pos_hld_range = 1000
+
+                # Time:     0 ms -> 3000 ms
+                # Scoring:  Awaiting hold at slider aimpoint (350 ms @ (100, 0))
+                map_values = self.map_values[1:]
+                map_time   = self.map_values[1, StdMapData.IDX_TIME]
+
+                for ms in range(0, 3000):
+                    score_data = StdScoreData._ScoreBuf(1)
+
+                    adv = process_release(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                    offset = ms - map_time
+
+                    expected_miss_adv = StdScoreData._StdScoreData__ADV_NOTE if slider_miss else StdScoreData._StdScoreData__ADV_AIMP
+
+                    if require_tap_hold:
+                        if recoverable_release:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
+                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
+                        else:
+                            self.assertEqual(adv, expected_miss_adv, f'Offset: {offset} ms')
+                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+                    else:
+                        # No need to tap
+                        self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
+                        self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
 
 
     def test_slider_release(self):
         settings = StdScoreData.Settings()
 
-        for require_tap_release in [True, False]:
-            for require_aim_release in [True, False]:
-                for require_tap_hold in [True, False]:
-                    for recoverable_release in [True, False]:
-                        for slider_miss in [True, False]:
-                            for miss_aim in [True, False]:
-                                cursor_xy = [1000, 1000] if miss_aim else [300, 0]
-
-                                settings.require_tap_hold    = require_tap_hold
-                                settings.require_tap_release = require_tap_release
-                                settings.require_aim_release = require_aim_release
-
-                                settings.recoverable_release = recoverable_release
-                                settings.miss_slider         = slider_miss
-
-                                # Set hitwindow ranges to what these tests have been written for
-                                settings.neg_rel_miss_range = 450    # ms point of early miss window
-                                settings.neg_rel_range      = 300    # ms point of early release window
-                                settings.pos_rel_range      = 300    # ms point of late release window
-                                settings.pos_rel_miss_range = 450    # ms point of late miss window
-
-                                # Set hitwindow ranges to what these tests have been written for
-                                self.neg_hld_range = 0
-                                self.pos_hld_range = 1000
-
-                                # Time:     0 ms -> 3000 ms
-                                # Scoring:  Awaiting release at slider end (750 ms @ (300, 0))
-                                for ms in range(0, 3000):
-                                    score_data = {}
-
-                                    adv = StdScoreData._StdScoreData__process_release(settings, score_data, self.map_data.iloc[3:].values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
-                                    offset = ms - self.map_data.iloc[3]['time']
-
-                                    def proc_required_tap():
-                                        if offset <= -settings.neg_rel_miss_range:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
-                                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
-
-                                        if -settings.neg_rel_miss_range < offset <= -settings.neg_rel_range:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
-
-                                        if -settings.neg_rel_range < offset <= settings.pos_rel_range:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITR, f'Offset: {offset} ms')
-
-                                        if settings.pos_rel_range < offset <= settings.pos_rel_miss_range:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
-
-                                        if settings.pos_rel_miss_range < offset:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
-                                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
-
-                                    def proc_required_aim():
-                                        self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                        self.assertEqual(score_data[0][6], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
-
-                                    def proc_required_non():
-                                        if offset < 0:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
-                                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
-                                        else:
-                                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
-                                            self.assertEqual(score_data[0][6], StdScoreData.TYPE_HITR, f'Offset: {offset} ms')
-
-                                    if not require_aim_release and not require_tap_release:
-                                        # No need to tap or aim; Automatic freebie
-                                        proc_required_non()
-                                        continue
-
-                                    if not require_aim_release and require_tap_release:
-                                        proc_required_tap()
-                                        continue
-
-                                    if require_aim_release and not require_tap_release:
-                                        if miss_aim:
-                                            proc_required_aim()
-                                        else:
-                                            proc_required_non()
-                                        continue
-
-                                    if require_aim_release and require_tap_release:
-                                        if miss_aim:
-                                            proc_required_aim()
-                                        else:
-                                            proc_required_tap()
-                                        continue
+        for require_tap_release, require_aim_release, require_tap_hold, recoverable_release, slider_miss, miss_aim in itertools.product([True, False], repeat=6):
+            with self.subTest(require_tap_release=require_tap_release, require_aim_release=require_aim_release, require_tap_hold=require_tap_hold, recoverable_release=recoverable_release, slider_miss=slider_miss, miss_aim=miss_aim):
+                cursor_xy = [1000, 1000] if miss_aim else [300, 0]
+
+                settings.require_tap_hold    = require_tap_hold
+                settings.require_tap_release = require_tap_release
+                settings.require_aim_release = require_aim_release
+
+                settings.recoverable_release = recoverable_release
+                settings.miss_slider         = slider_miss
+
+                # Set hitwindow ranges to what these tests have been written for
+                settings.neg_rel_miss_range = 450    # ms point of early miss window
+                settings.neg_rel_range      = 300    # ms point of early release window
+                settings.pos_rel_range      = 300    # ms point of late release window
+                settings.pos_rel_miss_range = 450    # ms point of late miss window
+
+                # Set hitwindow ranges to what these tests have been written for
+                settings.neg_hld_range = 0
+                settings.pos_hld_range = 1000
+
+                # Time:     0 ms -> 3000 ms
+                # Scoring:  Awaiting release at slider end (750 ms @ (300, 0))
+                map_values = self.map_values[3:]
+                map_time   = self.map_values[3, StdMapData.IDX_TIME]
+
+                for ms in range(0, 3000):
+                    score_data = StdScoreData._ScoreBuf(1)
+
+                    adv = process_release(settings, score_data, map_values, ms, cursor_xy[0], cursor_xy[1], [0, 0])
+                    offset = ms - map_time
+
+                    def proc_required_tap():
+                        if offset <= -settings.neg_rel_miss_range:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
+                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
+
+                        if -settings.neg_rel_miss_range < offset <= -settings.neg_rel_range:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
+                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+
+                        if -settings.neg_rel_range < offset <= settings.pos_rel_range:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
+                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITR, f'Offset: {offset} ms')
+
+                        if settings.pos_rel_range < offset <= settings.pos_rel_miss_range:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
+                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+
+                        if settings.pos_rel_miss_range < offset:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
+                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
+
+                    def proc_required_aim():
+                        self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
+                        self.assertEqual(score_data.type[0], StdScoreData.TYPE_MISS, f'Offset: {offset} ms')
+
+                    def proc_required_non():
+                        if offset < 0:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
+                            self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')
+                        else:
+                            self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOTE, f'Offset: {offset} ms')
+                            self.assertEqual(score_data.type[0], StdScoreData.TYPE_HITR, f'Offset: {offset} ms')
+
+                    if not require_aim_release and not require_tap_release:
+                        # No need to tap or aim; Automatic freebie
+                        proc_required_non()
+                        continue
+
+                    if not require_aim_release and require_tap_release:
+                        proc_required_tap()
+                        continue
+
+                    if require_aim_release and not require_tap_release:
+                        if miss_aim:
+                            proc_required_aim()
+                        else:
+                            proc_required_non()
+                        continue
+
+                    if require_aim_release and require_tap_release:
+                        if miss_aim:
+                            proc_required_aim()
+                        else:
+                            proc_required_tap()
+                        continue
 
 
     def test_circle_nomisaim(self):
@@ -235,11 +234,14 @@ class TestStdScoreDataRelease(unittest.TestCase):
         # Behavior:
         #   Scorepoint awaits PRESS -> NOP
         #   -> NOP
+        map_values = self.map_values[1:]
+        map_time   = self.map_values[1, StdMapData.IDX_TIME]
+
         for ms in range(0, 3000):
-            score_data = {}
-            adv = StdScoreData._StdScoreData__process_release(settings, score_data, self.map_data.iloc[1:].values, ms, 500, 500, [0, 0])
+            score_data = StdScoreData._ScoreBuf(1)
+            adv = process_release(settings, score_data, map_values, ms, 500, 500, [0, 0])
 
-            offset = ms - self.map_data.iloc[1]['time']
+            offset = ms - map_time
 
             self.assertEqual(adv, StdScoreData._StdScoreData__ADV_NOP, f'Offset: {offset} ms')
             self.assertEqual(len(score_data), 0, f'Offset: {offset} ms')